@@ -31,7 +31,7 @@ async def lifespan(app: FastAPI):
         
         # Test embeddings initialization
         from paas_ai.core.rag.embeddings import EmbeddingsFactory
-        embeddings = EmbeddingsFactory.create_embeddings(config.embedding)
+        embeddings = EmbeddingsFactory.get_or_create_embeddings(config.embedding)
         logger.info("✅ Embeddings initialized successfully")
         
     except Exception as e:
@@ -120,7 +120,7 @@ async def health_check() -> HealthStatus:
         
         # Check embeddings
         from paas_ai.core.rag.embeddings import EmbeddingsFactory
-        embeddings = EmbeddingsFactory.create_embeddings(config.embedding)
+        embeddings = EmbeddingsFactory.get_or_create_embeddings(config.embedding)
         components["embeddings"] = "healthy"
         
         # Check vectorstore (if exists)
@@ -85,16 +85,16 @@ def search(query: str, resource_type: str, limit: int, format: str, config_profi
             logger.info("-" * 50)
 
             for i, result in enumerate(results, 1):
-                logger.info(f"{i}. Score: {result.get('score', 0.0):.3f}")
-                logger.info(f"   Source: {result['metadata']['source_url']}")
-                logger.info(f"   Type: {result['metadata']['resource_type']}")
+                logger.info(f"{i}. Score: {result.score:.3f}")
+                logger.info(f"   Source: {result.metadata['source_url']}")
+                logger.info(f"   Type: {result.metadata['resource_type']}")
 
-                if result["metadata"].get("tags"):
-                    logger.info(f"   Tags: {', '.join(result['metadata']['tags'])}")
+                if result.metadata.get("tags"):
+                    logger.info(f"   Tags: {', '.join(result.metadata['tags'])}")
 
                 # Show content preview (first 200 chars)
-                content_preview = result["content"][:200]
-                if len(result["content"]) > 200:
+                content_preview = result.content[:200]
+                if len(result.content) > 200:
                     content_preview += "..."
 
                 logger.info(f"   Content: {content_preview}")
@@ -102,7 +102,11 @@ def search(query: str, resource_type: str, limit: int, format: str, config_profi
 
         else:
             # JSON format
-            output = {"query": query, "total_results": len(results), "results": results}
+            output = {
+                "query": query,
+                "total_results": len(results),
+                "results": [result.to_dict() for result in results],
+            }
             click.echo(json.dumps(output, indent=2))
 
         logger.success(f"Search completed - {len(results)} results found")
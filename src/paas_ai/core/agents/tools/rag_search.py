@@ -75,15 +75,15 @@ class RAGSearchTool(BaseTool):
             # Format results for the agent
             formatted_results = []
             for i, result in enumerate(results, 1):
-                content = result["content"]
-                score = result.get("score", 0.0)
-                source = result.get("metadata", {}).get("source_url", "Unknown")
+                content = result.content
+                score = result.score
+                source = (result.metadata or {}).get("source_url", "Unknown")
 
                 # Build result string with citation if available
                 result_parts = [f"Result {i} (score: {score:.2f}):", f"Content: {content}"]
 
                 # Add citation information if available
-                citation_info = result.get("citation")
+                citation_info = result.citation
                 if citation_info:
                     formatted_citation = citation_info.get("formatted", "")
                     if formatted_citation:
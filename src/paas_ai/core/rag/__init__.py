@@ -16,7 +16,7 @@ Key Components:
 """
 
 from .config import Config, ResourceConfig
-from .pipeline import RAGProcessor, create_resource_from_url, ConfigurationError
+from .pipeline import RAGProcessor, SearchHit, create_resource_from_url, ConfigurationError
 from .loaders import DocumentLoaderFactory
 from .splitters import TextSplitterFactory
 from .embeddings import EmbeddingsFactory
@@ -29,6 +29,7 @@ __all__ = [
     'Config',
     'ResourceConfig', 
     'RAGProcessor',
+    'SearchHit',
     'create_resource_from_url',
     'ConfigurationError',
     'DocumentLoaderFactory',
@@ -2,12 +2,22 @@
 Factory for creating embeddings using strategy pattern.
 """
 
+import threading
+import weakref
+from typing import Any, Tuple
+
 from langchain_core.embeddings import Embeddings
 
 from ..config import EmbeddingConfig, EmbeddingType
 from .registry import EmbeddingRegistry
 
 
+# Live embeddings instances by config, so identical configs share one loaded model.
+# Entries disappear once no pipeline, vectorstore or retriever holds the instance.
+_shared_embeddings: "weakref.WeakValueDictionary[Tuple[Any, str, str], Embeddings]" = weakref.WeakValueDictionary()
+_shared_embeddings_lock = threading.Lock()
+
+
 class EmbeddingsFactory:
     """Factory for creating embeddings using strategy pattern."""
     
@@ -23,6 +33,22 @@ class EmbeddingsFactory:
         # Create and return embeddings
         return strategy.create_embeddings(config)
     
+    @staticmethod
+    def get_or_create_embeddings(config: EmbeddingConfig) -> Embeddings:
+        """Get the live embeddings instance for an equivalent config, creating it if needed."""
+        # params carry device, normalization and precision settings
+        key = (config.type, config.model_name, repr(sorted(config.params.items())))
+        with _shared_embeddings_lock:
+            embeddings = _shared_embeddings.get(key)
+            if embeddings is None:
+                embeddings = EmbeddingsFactory.create_embeddings(config)
+                try:
+                    _shared_embeddings[key] = embeddings
+                except TypeError:
+                    # Not weak-referenceable; hand out an unshared instance
+                    pass
+        return embeddings
+    
     @staticmethod
     def list_supported_types() -> list[EmbeddingType]:
         """List all supported embedding types."""
@@ -15,10 +15,9 @@ class OpenAIEmbeddingStrategy(EmbeddingStrategy):
     
     def create_embeddings(self, config: EmbeddingConfig) -> Embeddings:
         """Create OpenAI embeddings."""
-        params = config.params.copy()
         return OpenAIEmbeddings(
             model=config.model_name,
-            **params
+            **config.params
         )
     
     def validate_config(self, config: EmbeddingConfig) -> None:
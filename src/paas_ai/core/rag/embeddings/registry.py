@@ -23,10 +23,10 @@ class EmbeddingRegistry:
     @classmethod
     def get_strategy(cls, embedding_type: EmbeddingType) -> EmbeddingStrategy:
         """Get strategy instance for the given embedding type."""
-        if embedding_type not in cls._strategies:
+        strategy_class = cls._strategies.get(embedding_type)
+        if strategy_class is None:
             raise ValueError(f"No strategy registered for embedding type: {embedding_type}")
         
-        strategy_class = cls._strategies[embedding_type]
         return strategy_class()
     
     @classmethod
@@ -13,13 +13,11 @@ class SentenceTransformersEmbeddingStrategy(EmbeddingStrategy):
     
     def create_embeddings(self, config: EmbeddingConfig) -> Embeddings:
         """Create SentenceTransformers embeddings."""
-        params = config.params.copy()
-        
         # Use HuggingFaceEmbeddings with SentenceTransformers models
         # This avoids the meta tensor issue with SentenceTransformerEmbeddings
         return HuggingFaceEmbeddings(
             model_name=config.model_name,
-            **params
+            **config.params
         )
     
     def validate_config(self, config: EmbeddingConfig) -> None:
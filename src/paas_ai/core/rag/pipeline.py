@@ -5,17 +5,23 @@ Main orchestrator for the RAG pipeline that coordinates document loading,
 processing, embedding, and storage following LangChain patterns.
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 import asyncio
+import hashlib
 import logging
 from urllib.parse import urlparse
 import requests
 from pathlib import Path
 import time
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
 
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from langchain_core.retrievers import BaseRetriever
+from langchain_chroma import Chroma
+from langchain_community.vectorstores import FAISS
 
 from .config import (
     Config, ResourceConfig, ResourceType,
@@ -25,10 +31,11 @@ from .loaders import DocumentLoaderFactory
 from .splitters import TextSplitterFactory
 from .embeddings import EmbeddingsFactory
 from .vectorstore import VectorStoreFactory
-from .retrievers import RetrieverFactory
+from .retrievers import CachedRetriever, RetrieverFactory
 from .processing import (
     ProcessingPipeline, ProcessingStage, ProcessingContext
 )
+from .citations import CitationFormatter, CitationStrategyRegistry, SourceReference
 from paas_ai.utils.logging import get_logger
 
 
@@ -95,6 +102,104 @@ class ConfigurationError(Exception):
     pass
 
 
+# Parsed URLs are memoized since the same resources are re-validated across syncs
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+def _validate_local_path(url: str) -> None:
+    """Check that a local file/directory exists."""
+    if not Path(url).exists():
+        raise ValidationError(f"Local path does not exist: {url}")
+
+
+def _validate_web_url(url: str) -> None:
+    """Check that a web URL is reachable."""
+    try:
+        response = requests.head(url, timeout=10, allow_redirects=True)
+        if response.status_code >= 400:
+            raise ValidationError(f"URL returned status {response.status_code}: {url}")
+    except requests.RequestException as e:
+        raise ValidationError(f"Failed to access URL {url}: {e}")
+
+
+def _skip_validation(url: str) -> None:
+    """Special URL schemes require special validation, but we'll skip for now."""
+
+
+# URL scheme -> validator, looked up once per resource in validate_resource
+_SCHEME_VALIDATORS = {
+    '': _validate_local_path,
+    'http': _validate_web_url,
+    'https': _validate_web_url,
+    'confluence': _skip_validation,
+    'notion': _skip_validation,
+    'github': _skip_validation,
+}
+
+
+# Metadata value types every supported vectorstore can store
+_SIMPLE_METADATA_TYPES = (str, bool, int, float)
+
+
+def _sanitize_documents(documents: List[Document]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Split documents into texts and metadatas, dropping complex metadata values."""
+    texts = [doc.page_content for doc in documents]
+    metadatas = [
+        {
+            key: value for key, value in doc.metadata.items()
+            if isinstance(value, _SIMPLE_METADATA_TYPES)
+        }
+        for doc in documents
+    ]
+    return texts, metadatas
+
+
+# Vectorstore class -> document count accessor used by get_stats
+_DOCUMENT_COUNTERS = {
+    Chroma: lambda vectorstore: vectorstore._collection.count(),
+    FAISS: lambda vectorstore: vectorstore.index.ntotal,
+}
+
+
+def _document_counter(vectorstore: VectorStore):
+    """Find the document count accessor for a vectorstore, including subclasses."""
+    for cls in type(vectorstore).__mro__:
+        if cls in _DOCUMENT_COUNTERS:
+            return _DOCUMENT_COUNTERS[cls]
+    return None
+
+
+def _content_hash(text: str) -> str:
+    """Compute a short, fast digest of chunk content, used as its document id."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _stored_ids(vectorstore: VectorStore, ids: List[str]) -> Set[str]:
+    """Return which of the given document ids the vectorstore already holds."""
+    try:
+        return {doc.id for doc in vectorstore.get_by_ids(ids)}
+    except NotImplementedError:
+        return set()
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A single knowledge base search result."""
+    content: str
+    score: float = 0.0
+    metadata: Optional[Dict[str, Any]] = None
+    citation: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict, omitting metadata and citation when unset."""
+        result = {'content': self.content, 'score': self.score}
+        if self.metadata is not None:
+            result['metadata'] = self.metadata
+        if self.citation is not None:
+            result['citation'] = self.citation
+        return result
+
+
 class VectorStoreStage(ProcessingStage):
     """Pipeline stage for storing documents in vectorstore."""
     
@@ -107,32 +212,89 @@ class VectorStoreStage(ProcessingStage):
         if not context.documents:
             return context
         
+        # Skip chunks whose content is already embedded (overlapping resources).
+        # Chunks are stored under their content hash, so chunks embedded by an
+        # earlier session are found in the vectorstore itself.
+        seen_hashes = self.rag_processor.content_hashes
+        hashes = [_content_hash(doc.page_content) for doc in context.documents]
+        vectorstore = self.rag_processor.vectorstore
+        if vectorstore:
+            unseen = [content_hash for content_hash in hashes if content_hash not in seen_hashes]
+            seen_hashes.update(_stored_ids(vectorstore, unseen))
+        
+        # Ordered like unique_documents; dict keys keep insertion order
+        new_hashes: Dict[str, None] = {}
+        unique_documents = []
+        for doc, content_hash in zip(context.documents, hashes):
+            if content_hash in seen_hashes or content_hash in new_hashes:
+                continue
+            new_hashes[content_hash] = None
+            unique_documents.append(doc)
+        
+        skipped = len(context.documents) - len(unique_documents)
+        if skipped:
+            self.rag_processor.logger.debug(f"Skipped {skipped} duplicate chunks")
+        context.documents = unique_documents
+        if not context.documents:
+            return context
+        
         # Filter complex metadata for compatibility with vectorstores like Chroma
-        from langchain_community.vectorstores.utils import filter_complex_metadata
-        filtered_documents = filter_complex_metadata(context.documents)
+        texts, metadatas = _sanitize_documents(context.documents)
         
-        if not self.rag_processor.vectorstore:
+        if not vectorstore:
             # Create new vectorstore
             self.rag_processor.vectorstore = VectorStoreFactory.create_vectorstore(
                 self.rag_processor.config.vectorstore,
                 self.rag_processor.embeddings,
-                filtered_documents
+                [
+                    Document(id=content_hash, page_content=text, metadata=metadata)
+                    for content_hash, text, metadata in zip(new_hashes, texts, metadatas)
+                ]
             )
             self.rag_processor.logger.info("Created new vectorstore")
         else:
             # Add to existing vectorstore
-            self.rag_processor.vectorstore.add_documents(filtered_documents)
-            self.rag_processor.logger.info(f"Added {len(filtered_documents)} documents to existing vectorstore")
+            vectorstore.add_texts(texts, metadatas=metadatas, ids=list(new_hashes))
+            self.rag_processor.logger.info(f"Added {len(texts)} documents to existing vectorstore")
+        
+        seen_hashes.update(new_hashes)
         
         # Create/update retriever
         self.rag_processor.retriever = RetrieverFactory.create_retriever(
             self.rag_processor.config.retriever,
             self.rag_processor.vectorstore
         )
+        # Cached query results predate the documents just added
+        if isinstance(self.rag_processor.retriever, CachedRetriever):
+            self.rag_processor.retriever.clear()
         
         return context
 
 
+def _bind_search_kwargs(retriever: BaseRetriever, search_kwargs: Dict[str, Any]) -> BaseRetriever:
+    """Copy a retriever so it searches with the given kwargs, leaving the original untouched."""
+    if isinstance(retriever, CachedRetriever):
+        # The copy keeps sharing the result cache, which is keyed on search kwargs
+        return retriever.model_copy(update={
+            'retriever': _bind_search_kwargs(retriever.retriever, search_kwargs)
+        })
+    return retriever.model_copy(update={'search_kwargs': search_kwargs})
+
+
+def _merge_filters(
+    vectorstore: Optional[VectorStore],
+    configured: Optional[Dict[str, Any]],
+    resource_filter: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Combine a configured metadata filter with the resource type filter."""
+    if not configured:
+        return resource_filter
+    if isinstance(vectorstore, Chroma):
+        # Chroma where clauses take a single condition per dict
+        return {'$and': [configured, resource_filter]}
+    return {**configured, **resource_filter}
+
+
 class RAGProcessor:
     """Main RAG pipeline processor."""
     
@@ -144,13 +306,17 @@ class RAGProcessor:
         
         # Initialize components with proper error handling
         try:
-            self.embeddings = EmbeddingsFactory.create_embeddings(config.embedding)
+            self.embeddings = EmbeddingsFactory.get_or_create_embeddings(config.embedding)
         except Exception as e:
             self._handle_initialization_error(e, config)
             
         self.vectorstore = None
         self.retriever = None
         
+        # Content hashes (document ids) of chunks known to be stored, used to
+        # skip re-embedding duplicate chunks
+        self.content_hashes: Set[str] = set()
+        
         # Initialize citation enricher if enabled (use converted config)
         self.citation_enricher = None
         if hasattr(self.config, 'citation') and self.config.citation and self.config.citation.enabled:
@@ -261,32 +427,11 @@ class RAGProcessor:
         url = resource.url
         self.logger.debug(f"Validating resource: {url}")
         
-        # Parse URL
-        parsed = urlparse(url)
-        
-        # Check if it's a local file/directory
-        if not parsed.scheme:
-            path = Path(url)
-            if not path.exists():
-                raise ValidationError(f"Local path does not exist: {url}")
-            return
-        
-        # Check if it's a valid web URL
-        if parsed.scheme in ['http', 'https']:
-            try:
-                response = requests.head(url, timeout=10, allow_redirects=True)
-                if response.status_code >= 400:
-                    raise ValidationError(f"URL returned status {response.status_code}: {url}")
-            except requests.RequestException as e:
-                raise ValidationError(f"Failed to access URL {url}: {e}")
-            return
-        
-        # Check special URL schemes
-        if parsed.scheme in ['confluence', 'notion', 'github']:
-            # These require special validation, but we'll skip for now
-            return
-        
-        raise ValidationError(f"Unsupported URL scheme: {parsed.scheme}")
+        scheme = _parse_url(url).scheme
+        validator = _SCHEME_VALIDATORS.get(scheme)
+        if validator is None:
+            raise ValidationError(f"Unsupported URL scheme: {scheme}")
+        validator(url)
     
     async def add_resources(self, resources: List[ResourceConfig]) -> Dict[str, Any]:
         """Add multiple resources to the knowledge base using the processing pipeline."""
@@ -333,22 +478,36 @@ class RAGProcessor:
         resource_type: Optional[ResourceType] = None,
         limit: int = 5,
         include_metadata: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> List['SearchHit']:
         """Search the knowledge base."""
         if not self.retriever:
             raise ValueError("No retriever available. Add resources first.")
         
         self.logger.debug(f"Searching for: '{query}'")
         
-        # Update search kwargs with limit
-        if hasattr(self.retriever, 'search_kwargs'):
-            self.retriever.search_kwargs['k'] = limit
-        
+        # Search with per-call kwargs on a copy; the retriever itself may be
+        # shared with other processors through the factory cache
+        retriever = self.retriever
+        search_kwargs = getattr(retriever, 'search_kwargs', None)
+        post_filter = bool(resource_type) and search_kwargs is None
+        if search_kwargs is not None:
+            call_kwargs = {**search_kwargs, 'k': limit}
+            # Push the resource type filter down to the vectorstore so the
+            # retriever returns the top `limit` matches of that type
+            if resource_type:
+                call_kwargs['filter'] = _merge_filters(
+                    self.vectorstore,
+                    call_kwargs.get('filter'),
+                    {'resource_type': getattr(resource_type, 'value', resource_type)}
+                )
+            retriever = _bind_search_kwargs(retriever, call_kwargs)
+
         # Retrieve documents
-        docs = self.retriever.invoke(query)
-        
-        # Filter by resource type if specified
-        if resource_type:
+        docs = retriever.invoke(query)
+
+        # Retrievers without search kwargs (ensemble, multi-query) cannot
+        # take a metadata filter, so fall back to filtering the results
+        if post_filter:
             docs = [
                 doc for doc in docs
                 if doc.metadata.get('resource_type') == resource_type
@@ -357,14 +516,12 @@ class RAGProcessor:
         # Format results
         results = []
         for doc in docs:
-            result = {
-                'content': doc.page_content,
-                'score': doc.metadata.get('score', 0.0),
-            }
+            metadata = None
+            citation = None
             
             if include_metadata:
                 # Basic metadata
-                result['metadata'] = {
+                metadata = {
                     'source_url': doc.metadata.get('source_url'),
                     'resource_type': doc.metadata.get('resource_type'),
                     'tags': doc.metadata.get('tags', []),
@@ -376,9 +533,6 @@ class RAGProcessor:
                     hasattr(self.config, 'citation') and 
                     self.config.citation and 
                     self.config.citation.enabled):
-                    from .citations import CitationFormatter
-                    from .citations.models import SourceReference
-                    
                     # Extract citation reference
                     citation_ref_data = doc.metadata.get('citation_reference')
                     if citation_ref_data:
@@ -397,7 +551,7 @@ class RAGProcessor:
                             )
                             
                             # Add citation information to result
-                            result['citation'] = {
+                            citation = {
                                 'formatted': formatted_citation,
                                 'source_reference': citation_ref_data,
                                 'verbosity': doc.metadata.get('citation_verbosity'),
@@ -407,24 +561,28 @@ class RAGProcessor:
                             # Add citation link if available
                             strategy_registry = getattr(self, '_citation_strategy_registry', None)
                             if not strategy_registry:
-                                from .citations.strategies import CitationStrategyRegistry
                                 self._citation_strategy_registry = CitationStrategyRegistry()
                                 strategy_registry = self._citation_strategy_registry
                             
                             strategy = strategy_registry.get_strategy(strategy_name)
                             citation_link = strategy.generate_citation_link(source_ref)
                             if citation_link:
-                                result['citation']['link'] = citation_link
+                                citation['link'] = citation_link
                                 
                         except Exception as e:
                             self.logger.warning(f"Failed to format citation: {e}")
                             # Add basic citation fallback
-                            result['citation'] = {
+                            citation = {
                                 'formatted': f"[{doc.metadata.get('source_url', 'Unknown source')}]",
                                 'error': str(e)
                             }
             
-            results.append(result)
+            results.append(SearchHit(
+                content=doc.page_content,
+                score=doc.metadata.get('score', 0.0),
+                metadata=metadata,
+                citation=citation
+            ))
         
         self.logger.debug(f"Found {len(results)} results")
         return results
@@ -440,16 +598,10 @@ class RAGProcessor:
             }
         
         # Try to get document count
+        count_documents = _document_counter(self.vectorstore)
         try:
-            if hasattr(self.vectorstore, '_collection'):
-                # Chroma
-                total_docs = self.vectorstore._collection.count()
-            elif hasattr(self.vectorstore, 'index'):
-                # FAISS
-                total_docs = self.vectorstore.index.ntotal
-            else:
-                total_docs = "unknown"
-        except:
+            total_docs = count_documents(self.vectorstore) if count_documents else "unknown"
+        except Exception:
             total_docs = "unknown"
         
         return {
@@ -465,13 +617,13 @@ class RAGProcessor:
         self.logger.warning("Clearing knowledge base")
         
         if self.config.vectorstore.persist_directory:
-            import shutil
             if self.config.vectorstore.persist_directory.exists():
                 shutil.rmtree(self.config.vectorstore.persist_directory)
                 self.logger.info("Deleted persistent storage")
         
         self.vectorstore = None
         self.retriever = None
+        self.content_hashes.clear()
         
         self.logger.success("Knowledge base cleared")
 
@@ -8,9 +8,10 @@ from .base import RetrieverStrategy
 from .similarity import SimilarityRetrieverStrategy
 from .mmr import MMRRetrieverStrategy
 from .similarity_score_threshold import SimilarityScoreThresholdRetrieverStrategy
-from .ensemble import EnsembleRetrieverStrategy
+from .ensemble import EnsembleRetrieverStrategy, LazyEnsembleRetriever
 from .multi_query import MultiQueryRetrieverStrategy
 from .parent_document import ParentDocumentRetrieverStrategy
+from .cached import CachedRetriever
 
 __all__ = [
     'RetrieverFactory',
@@ -20,6 +21,8 @@ __all__ = [
     'MMRRetrieverStrategy',
     'SimilarityScoreThresholdRetrieverStrategy',
     'EnsembleRetrieverStrategy',
+    'LazyEnsembleRetriever',
     'MultiQueryRetrieverStrategy',
     'ParentDocumentRetrieverStrategy',
+    'CachedRetriever',
 ] 
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Query result cache for retrievers.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
+
+
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+
+class CachedRetriever(BaseRetriever):
+    """Wrap a retriever with an LRU cache of results per query and search kwargs."""
+
+    retriever: BaseRetriever
+    cache_size: int = DEFAULT_QUERY_CACHE_SIZE
+
+    _cache: "OrderedDict[Tuple[str, str], List[Document]]" = PrivateAttr(default_factory=OrderedDict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def search_kwargs(self) -> Optional[Dict[str, Any]]:
+        """Search kwargs of the wrapped retriever, so callers can still tune k and filters."""
+        return getattr(self.retriever, 'search_kwargs', None)
+
+    def _cache_key(self, query: str) -> Hashable:
+        search_kwargs = self.search_kwargs
+        return (query, repr(sorted(search_kwargs.items())) if search_kwargs else '')
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        """Return cached documents for the query, retrieving them on a miss."""
+        key = self._cache_key(query)
+        with self._lock:
+            documents = self._cache.get(key)
+            if documents is not None:
+                self._cache.move_to_end(key)
+                return list(documents)
+
+        documents = self.retriever.invoke(
+            query, config={"callbacks": run_manager.get_child()}
+        )
+
+        with self._lock:
+            self._cache[key] = documents
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(documents)
+
+    def clear(self) -> None:
+        """Drop all cached results, e.g. after the underlying vectorstore changed."""
+        with self._lock:
+            self._cache.clear()
@@ -2,14 +2,190 @@
 Ensemble retriever strategy.
 """
 
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_community.vectorstores import FAISS
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from langchain_core.retrievers import BaseRetriever
 from langchain.retrievers import EnsembleRetriever
+from pydantic import PrivateAttr
 
 from .base import RetrieverStrategy
 from ..config import RetrieverConfig
 
 
+def _maximal_marginal_relevance(
+    query_vector: np.ndarray,
+    vectors: np.ndarray,
+    lambda_mult: float = 0.5,
+    k: int = 4
+) -> List[int]:
+    """
+    Greedy MMR selection over candidate vectors.
+    
+    Same picks as langchain's maximal_marginal_relevance, but each step is
+    one matrix-vector product that updates every candidate's redundancy,
+    instead of recomputing similarities to the whole selected set.
+    """
+    k = min(k, len(vectors))
+    if k <= 0:
+        return []
+    
+    norms = np.linalg.norm(vectors, axis=1)
+    normalized = vectors / np.where(norms == 0, 1.0, norms)[:, None]
+    query_norm = np.linalg.norm(query_vector)
+    similarity_to_query = normalized @ (query_vector / (query_norm or 1.0))
+    
+    pick = int(np.argmax(similarity_to_query))
+    selected = [pick]
+    redundancy = normalized @ normalized[pick]
+    available = np.ones(len(vectors), dtype=bool)
+    available[pick] = False
+    
+    while len(selected) < k:
+        scores = lambda_mult * similarity_to_query - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        pick = int(np.argmax(scores))
+        selected.append(pick)
+        available[pick] = False
+        np.maximum(redundancy, normalized @ normalized[pick], out=redundancy)
+    return selected
+
+
+class LazyEnsembleRetriever(BaseRetriever):
+    """
+    Similarity + MMR ensemble served from a single vectorstore search.
+    
+    Over-fetches similarity candidates once, reranks them locally with MMR
+    and fuses both rankings with weighted reciprocal rank fusion, like
+    EnsembleRetriever does for its member retrievers.
+    """
+    
+    vectorstore: VectorStore
+    search_kwargs: Dict[str, Any] = {"k": 4}
+    weights: List[float] = [0.5, 0.5]
+    fetch_multiplier: int = 2
+    c: int = 60
+    
+    # FAISS docstore id -> index position, rebuilt when a lookup goes stale
+    _faiss_positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        """Get documents ranked by fused similarity and MMR order."""
+        embeddings = self.vectorstore.embeddings
+        if embeddings is None:
+            raise ValueError("Lazy ensemble retrieval requires a vectorstore with embeddings")
+        
+        k = self.search_kwargs.get("k", 4)
+        fetch_k = self.search_kwargs.get("fetch_k") or k * self.fetch_multiplier
+        query_vector = embeddings.embed_query(query)
+        
+        candidates, vectors = self._fetch_candidates(
+            query_vector, fetch_k, self.search_kwargs.get("filter")
+        )
+        if not candidates:
+            return []
+        
+        similarity_ranked = candidates[:k]
+        mmr_ranked = [
+            candidates[i]
+            for i in _maximal_marginal_relevance(
+                np.asarray(query_vector, dtype=np.float32),
+                vectors,
+                lambda_mult=self.search_kwargs.get("lambda_mult", 0.5),
+                k=k,
+            )
+        ]
+        return self._fuse([similarity_ranked, mmr_ranked])
+    
+    def _fuse(self, ranked_lists: List[List[Document]]) -> List[Document]:
+        """Weighted reciprocal rank fusion, deduplicating on page content."""
+        scores: Dict[str, float] = {}
+        documents: Dict[str, Document] = {}
+        for weight, ranked in zip(self.weights, ranked_lists):
+            for rank, doc in enumerate(ranked, start=1):
+                key = doc.page_content
+                documents.setdefault(key, doc)
+                scores[key] = scores.get(key, 0.0) + weight / (rank + self.c)
+        return [documents[key] for key in sorted(scores, key=scores.get, reverse=True)]
+    
+    def _fetch_candidates(
+        self,
+        query_vector: List[float],
+        fetch_k: int,
+        filter: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Document], np.ndarray]:
+        """Fetch candidates in similarity order along with their stored vectors."""
+        if isinstance(self.vectorstore, FAISS):
+            return self._fetch_faiss_candidates(query_vector, fetch_k, filter)
+        if isinstance(self.vectorstore, Chroma):
+            return self._fetch_chroma_candidates(query_vector, fetch_k, filter)
+        
+        # No access to stored vectors; embed the candidates instead
+        search_kwargs = {"filter": filter} if filter else {}
+        candidates = self.vectorstore.similarity_search_by_vector(query_vector, k=fetch_k, **search_kwargs)
+        return candidates, self._embed_candidates(candidates)
+    
+    def _fetch_faiss_candidates(self, query_vector, fetch_k, filter):
+        candidates = [
+            doc for doc, _ in self.vectorstore.similarity_search_with_score_by_vector(
+                query_vector, k=fetch_k, filter=filter
+            )
+        ]
+        if not candidates:
+            return candidates, np.empty((0, len(query_vector)), dtype=np.float32)
+        
+        positions = self._get_faiss_positions(candidates)
+        try:
+            vectors = np.vstack([
+                self.vectorstore.index.reconstruct(positions[doc.id]) for doc in candidates
+            ])
+        except (KeyError, RuntimeError):
+            # e.g. IVF indexes without a direct map cannot reconstruct vectors
+            vectors = self._embed_candidates(candidates)
+        return candidates, vectors
+    
+    def _get_faiss_positions(self, candidates: List[Document]) -> Dict[str, int]:
+        """Map docstore ids to index positions, rebuilding when the index has changed."""
+        index_to_docstore_id = self.vectorstore.index_to_docstore_id
+        positions = self._faiss_positions
+        if any(index_to_docstore_id.get(positions.get(doc.id)) != doc.id for doc in candidates):
+            positions = {doc_id: position for position, doc_id in index_to_docstore_id.items()}
+            self._faiss_positions = positions
+        return positions
+    
+    def _fetch_chroma_candidates(self, query_vector, fetch_k, filter):
+        result = self.vectorstore._collection.query(
+            query_embeddings=[query_vector],
+            n_results=fetch_k,
+            where=filter or None,
+            include=["documents", "metadatas", "embeddings"],
+        )
+        candidates = [
+            Document(id=doc_id, page_content=text, metadata=metadata or {})
+            for doc_id, text, metadata in zip(
+                result["ids"][0], result["documents"][0], result["metadatas"][0]
+            )
+        ]
+        vectors = np.asarray(result["embeddings"][0], dtype=np.float32)
+        return candidates, vectors.reshape(len(candidates), -1)
+    
+    def _embed_candidates(self, candidates: List[Document]) -> np.ndarray:
+        return np.asarray(
+            self.vectorstore.embeddings.embed_documents([doc.page_content for doc in candidates]),
+            dtype=np.float32,
+        )
+
+
 class EnsembleRetrieverStrategy(RetrieverStrategy):
     """Strategy for ensemble-based retrieval."""
     
@@ -20,8 +196,18 @@ class EnsembleRetrieverStrategy(RetrieverStrategy):
         llm=None
     ) -> BaseRetriever:
         """Create an ensemble retriever."""
-        search_kwargs = config.search_kwargs.copy()
-        params = config.params.copy()
+        search_kwargs = config.search_kwargs
+        weights = config.params.get('weights', [0.5, 0.5])
+        params = {key: value for key, value in config.params.items() if key not in ('weights', 'lazy')}
+        
+        # Single over-fetched search reranked locally instead of two searches
+        if config.params.get('lazy', False):
+            return LazyEnsembleRetriever(
+                vectorstore=vectorstore,
+                search_kwargs=search_kwargs,
+                weights=weights,
+                **params
+            )
         
         # Create multiple retrievers for ensemble
         similarity_retriever = vectorstore.as_retriever(
@@ -33,11 +219,10 @@ class EnsembleRetrieverStrategy(RetrieverStrategy):
             search_kwargs=search_kwargs
         )
         
-        weights = params.get('weights', [0.5, 0.5])
         return EnsembleRetriever(
             retrievers=[similarity_retriever, mmr_retriever],
             weights=weights,
-            **{k: v for k, v in params.items() if k != 'weights'}
+            **params
         )
     
     def validate_config(self, config: RetrieverConfig) -> None:
@@ -56,3 +241,10 @@ class EnsembleRetrieverStrategy(RetrieverStrategy):
         
         if abs(sum(weights) - 1.0) > 0.01:  # Allow small floating point errors
             raise ValueError("Weights must sum to 1.0")
+        
+        if not isinstance(config.params.get('lazy', False), bool):
+            raise ValueError("params['lazy'] must be a boolean")
+        
+        fetch_multiplier = config.params.get('fetch_multiplier', 2)
+        if not isinstance(fetch_multiplier, int) or fetch_multiplier < 1:
+            raise ValueError("params['fetch_multiplier'] must be a positive integer")
@@ -2,11 +2,23 @@
 Factory for creating retrievers based on configuration.
 """
 
+import threading
+from collections import OrderedDict
+from typing import Any, Tuple
+
 from langchain_core.vectorstores import VectorStore
 from langchain_core.retrievers import BaseRetriever
 
 from ..config import RetrieverConfig
 from .registry import RetrieverRegistry
+from .cached import CachedRetriever
+
+
+# Recently built retrievers, reused for the same vectorstore, llm and configuration.
+# Values are (vectorstore, llm, retriever); holding the vectorstore keeps its id() stable.
+_RETRIEVER_CACHE_SIZE = 32
+_retriever_cache: "OrderedDict[Tuple, Tuple[VectorStore, Any, BaseRetriever]]" = OrderedDict()
+_retriever_cache_lock = threading.Lock()
 
 
 class RetrieverFactory:
@@ -19,14 +31,52 @@ class RetrieverFactory:
         llm=None
     ) -> BaseRetriever:
         """Create a retriever based on configuration using registry pattern."""
+        # query_cache_size is handled here rather than by the strategies
+        query_cache_size = config.params.get('query_cache_size')
+        if isinstance(query_cache_size, int):
+            config = config.model_copy(update={
+                'params': {k: v for k, v in config.params.items() if k != 'query_cache_size'}
+            })
+        
         # Get strategy from registry
         strategy = RetrieverRegistry.get_strategy(config.type)
         
         # Validate configuration before creating retriever
         strategy.validate_config(config)
         
+        key = (
+            id(vectorstore),
+            id(llm),
+            type(strategy),
+            config.type,
+            repr(sorted(config.search_kwargs.items())),
+            repr(sorted(config.params.items())),
+            query_cache_size,
+        )
+        with _retriever_cache_lock:
+            cached = _retriever_cache.get(key)
+            if cached is not None and cached[0] is vectorstore and cached[1] is llm:
+                _retriever_cache.move_to_end(key)
+                return cached[2]
+        
         # Create retriever using the appropriate strategy
-        return strategy.create_retriever(config, vectorstore, llm)
+        retriever = strategy.create_retriever(config, vectorstore, llm)
+        if retriever is not None and isinstance(query_cache_size, int) and query_cache_size > 0:
+            retriever = CachedRetriever(retriever=retriever, cache_size=query_cache_size)
+        
+        if retriever is not None:
+            with _retriever_cache_lock:
+                _retriever_cache[key] = (vectorstore, llm, retriever)
+                if len(_retriever_cache) > _RETRIEVER_CACHE_SIZE:
+                    _retriever_cache.popitem(last=False)
+        
+        return retriever
+    
+    @staticmethod
+    def clear_cache():
+        """Drop all cached retrievers."""
+        with _retriever_cache_lock:
+            _retriever_cache.clear()
     
     @staticmethod
     def register_strategy(retriever_type, strategy_class):
@@ -19,19 +19,13 @@ class MMRRetrieverStrategy(RetrieverStrategy):
         llm=None
     ) -> BaseRetriever:
         """Create an MMR retriever."""
-        search_kwargs = config.search_kwargs.copy()
-        params = config.params.copy()
-        
-        # Add default values if not provided
-        if 'fetch_k' not in search_kwargs:
-            search_kwargs['fetch_k'] = 20
-        if 'lambda_mult' not in search_kwargs:
-            search_kwargs['lambda_mult'] = 0.5
+        # Default values, overridden by anything provided
+        search_kwargs = {'fetch_k': 20, 'lambda_mult': 0.5, **config.search_kwargs}
         
         return vectorstore.as_retriever(
             search_type="mmr",
             search_kwargs=search_kwargs,
-            **params
+            **config.params
         )
     
     def validate_config(self, config: RetrieverConfig) -> None:
@@ -23,18 +23,15 @@ class MultiQueryRetrieverStrategy(RetrieverStrategy):
         if llm is None:
             raise ValueError("LLM is required for MultiQueryRetriever")
         
-        search_kwargs = config.search_kwargs.copy()
-        params = config.params.copy()
-        
         base_retriever = vectorstore.as_retriever(
             search_type="similarity",
-            search_kwargs=search_kwargs
+            search_kwargs=config.search_kwargs
         )
         
         return MultiQueryRetriever.from_llm(
             retriever=base_retriever,
             llm=llm,
-            **params
+            **config.params
         )
     
     def validate_config(self, config: RetrieverConfig) -> None:
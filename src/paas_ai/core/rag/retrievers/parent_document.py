@@ -20,7 +20,7 @@ class ParentDocumentRetrieverStrategy(RetrieverStrategy):
         llm=None
     ) -> BaseRetriever:
         """Create a parent document retriever."""
-        params = config.params.copy()
+        params = config.params
         
         if 'child_splitter' not in params:
             raise ValueError("child_splitter is required for ParentDocumentRetriever")
@@ -30,10 +30,10 @@ class RetrieverRegistry:
     @classmethod
     def get_strategy(cls, retriever_type: RetrieverType) -> RetrieverStrategy:
         """Get strategy instance for the given retriever type."""
-        if retriever_type not in cls._strategies:
+        strategy_class = cls._strategies.get(retriever_type)
+        if strategy_class is None:
             raise ValueError(f"No strategy registered for retriever type: {retriever_type}")
         
-        strategy_class = cls._strategies[retriever_type]
         return strategy_class()
     
     @classmethod
@@ -19,13 +19,11 @@ class SimilarityRetrieverStrategy(RetrieverStrategy):
         llm=None
     ) -> BaseRetriever:
         """Create a similarity retriever."""
-        search_kwargs = config.search_kwargs.copy()
-        params = config.params.copy()
-        
+        # as_retriever validates search_kwargs into its own dict, so no copy is needed
         return vectorstore.as_retriever(
             search_type="similarity",
-            search_kwargs=search_kwargs,
-            **params
+            search_kwargs=config.search_kwargs,
+            **config.params
         )
     
     def validate_config(self, config: RetrieverConfig) -> None:
@@ -19,17 +19,13 @@ class SimilarityScoreThresholdRetrieverStrategy(RetrieverStrategy):
         llm=None
     ) -> BaseRetriever:
         """Create a similarity score threshold retriever."""
-        search_kwargs = config.search_kwargs.copy()
-        params = config.params.copy()
-        
-        # Add default score_threshold if not provided
-        if 'score_threshold' not in search_kwargs:
-            search_kwargs['score_threshold'] = 0.0
+        # Default score_threshold, overridden if provided
+        search_kwargs = {'score_threshold': 0.0, **config.search_kwargs}
         
         return vectorstore.as_retriever(
             search_type="similarity_score_threshold",
             search_kwargs=search_kwargs,
-            **params
+            **config.params
         )
     
     def validate_config(self, config: RetrieverConfig) -> None:
@@ -3,7 +3,8 @@ Base strategy interface for vector stores.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
@@ -11,6 +12,31 @@ from langchain_core.vectorstores import VectorStore
 from ...config.schemas import VectorStoreConfig
 
 
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+
+
+def embed_in_batches(
+    embeddings: Embeddings,
+    texts: List[str],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    concurrency: int = 1
+) -> Iterator[List[List[float]]]:
+    """
+    Embed texts in fixed-size batches, yielding each batch's vectors in order.
+    
+    With concurrency > 1 batches are embedded on a thread pool, which overlaps
+    requests to remote embedding APIs; results are still yielded in text order.
+    """
+    batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+    if concurrency <= 1 or len(batches) <= 1:
+        for batch in batches:
+            yield embeddings.embed_documents(batch)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+        yield from executor.map(embeddings.embed_documents, batches)
+
+
 class VectorStoreStrategy(ABC):
     """Base strategy interface for vector stores."""
     
@@ -2,18 +2,72 @@
 Chroma vector store strategy.
 """
 
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 
+import chromadb
+from chromadb.config import Settings
 from langchain_chroma import Chroma
 
-from .base import VectorStoreStrategy
+from .base import DEFAULT_EMBEDDING_BATCH_SIZE, VectorStoreStrategy
 from ...config.schemas import VectorStoreConfig
 
 
+# Chroma HNSW settings accepted in params['hnsw'], stored as 'hnsw:<key>' collection metadata
+HNSW_PARAM_KEYS = ("space", "M", "construction_ef", "search_ef", "num_threads", "batch_size", "sync_threshold", "resize_factor")
+
+# Ingestion-only params consumed by create_vectorstore, never passed to Chroma
+INGEST_PARAM_KEYS = ("ingest_concurrency", "embedding_batch_size")
+
+# One PersistentClient per persist directory, shared by every store opened on it
+_chroma_clients: Dict[str, Any] = {}
+_chroma_clients_lock = threading.Lock()
+
+
+def _get_client(persist_directory: str):
+    """Get the shared persistent client for a directory, opening it on first use."""
+    with _chroma_clients_lock:
+        client = _chroma_clients.get(persist_directory)
+        if client is None:
+            client = chromadb.PersistentClient(
+                path=persist_directory,
+                settings=Settings(anonymized_telemetry=False)
+            )
+            _chroma_clients[persist_directory] = client
+    return client
+
+
+def clear_clients() -> None:
+    """Forget shared clients, e.g. after their directories were deleted."""
+    with _chroma_clients_lock:
+        _chroma_clients.clear()
+
+
+def _storage_kwargs(persist_directory: Optional[str]) -> Dict[str, Any]:
+    """Chroma kwargs selecting the shared persistent client, or in-memory storage."""
+    if persist_directory is None:
+        return {"persist_directory": None}
+    return {"client": _get_client(persist_directory)}
+
+
+def _collection_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Move params['hnsw'] into collection_metadata so the index is built with it up front."""
+    hnsw = params.get("hnsw")
+    if not hnsw:
+        return params
+    params = {key: value for key, value in params.items() if key != "hnsw"}
+    params["collection_metadata"] = {
+        **(params.get("collection_metadata") or {}),
+        **{f"hnsw:{key}": value for key, value in hnsw.items()},
+    }
+    return params
+
+
 class ChromaVectorStoreStrategy(VectorStoreStrategy):
     """Strategy for Chroma vector stores."""
     
@@ -30,21 +84,36 @@ class ChromaVectorStoreStrategy(VectorStoreStrategy):
             # Ensure directory exists
             Path(persist_directory).mkdir(parents=True, exist_ok=True)
         
-        params = config.params.copy()
+        params = _collection_params(config.params.copy())
+        concurrency = params.pop("ingest_concurrency", 1)
+        batch_size = params.pop("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE)
+        storage = _storage_kwargs(persist_directory)
         
-        if documents:
+        if documents and concurrency > 1:
+            vectorstore = Chroma(
+                embedding_function=embeddings,
+                collection_name=config.collection_name,
+                **storage,
+                **params
+            )
+            # Each worker embeds and upserts its own batch through the shared client
+            batches = [documents[start:start + batch_size] for start in range(0, len(documents), batch_size)]
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+                list(executor.map(vectorstore.add_documents, batches))
+            return vectorstore
+        elif documents:
             return Chroma.from_documents(
                 documents=documents,
                 embedding=embeddings,
                 collection_name=config.collection_name,
-                persist_directory=persist_directory,
+                **storage,
                 **params
             )
         else:
             return Chroma(
                 embedding_function=embeddings,
                 collection_name=config.collection_name,
-                persist_directory=persist_directory,
+                **storage,
                 **params
             )
     
@@ -62,13 +131,13 @@ class ChromaVectorStoreStrategy(VectorStoreStrategy):
         if not persist_dir.exists():
             return None
         
+        params = {key: value for key, value in config.params.items() if key not in INGEST_PARAM_KEYS}
         try:
-            params = config.params.copy()
             return Chroma(
                 embedding_function=embeddings,
                 collection_name=config.collection_name,
-                persist_directory=str(persist_dir),
-                **params
+                client=_get_client(str(persist_dir)),
+                **_collection_params(params)
             )
         except Exception:
             return None
@@ -82,4 +151,20 @@ class ChromaVectorStoreStrategy(VectorStoreStrategy):
         # Remove hyphens and underscores, then check if remaining characters are alphanumeric
         cleaned_name = config.collection_name.replace('_', '').replace('-', '')
         if not cleaned_name.isalnum():
-            raise ValueError("collection_name must contain only alphanumeric characters, hyphens, and underscores") 
\ No newline at end of file
+            raise ValueError("collection_name must contain only alphanumeric characters, hyphens, and underscores")
+        
+        params = getattr(config, 'params', None) or {}
+        concurrency = params.get("ingest_concurrency", 1)
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+            raise ValueError("ingest_concurrency must be a positive integer")
+        
+        hnsw = params.get("hnsw")
+        if hnsw is not None:
+            if not isinstance(hnsw, dict):
+                raise ValueError("params['hnsw'] must be a dictionary")
+            unknown = set(hnsw) - set(HNSW_PARAM_KEYS)
+            if unknown:
+                raise ValueError(
+                    f"Unsupported hnsw settings: {', '.join(sorted(unknown))}. "
+                    f"Supported settings: {', '.join(HNSW_PARAM_KEYS)}"
+                )
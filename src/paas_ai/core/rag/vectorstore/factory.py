@@ -2,7 +2,9 @@
 Factory for creating vector stores based on configuration.
 """
 
-from typing import List, Optional, Dict, Type
+import os
+import threading
+from typing import Any, List, Optional, Dict, Tuple, Type
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
@@ -10,11 +12,38 @@ from langchain_core.vectorstores import VectorStore
 
 from paas_ai.core.config.schemas import VectorStoreConfig, VectorStoreType
 from .base import VectorStoreStrategy
-from .chroma import ChromaVectorStoreStrategy
+from .chroma import ChromaVectorStoreStrategy, clear_clients as clear_chroma_clients
 from .faiss import FAISSVectorStoreStrategy
 from .pinecone import PineconeVectorStoreStrategy
 
 
+# Persisted vector stores by location, reused while their files are unchanged.
+# Values are (strategy_class, embeddings, mtime_ns, vectorstore).
+_vs_cache: Dict[Tuple[Any, str, Optional[str], str], Tuple[type, Embeddings, int, VectorStore]] = {}
+_vs_cache_lock = threading.Lock()
+
+
+def _persist_mtime(persist_directory) -> Optional[int]:
+    """Latest modification time of a persist directory and its top-level entries."""
+    try:
+        mtime = os.stat(persist_directory).st_mtime_ns
+        with os.scandir(persist_directory) as entries:
+            for entry in entries:
+                mtime = max(mtime, entry.stat().st_mtime_ns)
+        return mtime
+    except (OSError, TypeError):
+        return None
+
+
+def _cache_key(config: VectorStoreConfig) -> Tuple[Any, str, Optional[str], str]:
+    return (
+        config.type,
+        str(config.persist_directory),
+        getattr(config, 'collection_name', None),
+        repr(sorted((getattr(config, 'params', None) or {}).items())),
+    )
+
+
 class VectorStoreFactory:
     """Factory for creating vector stores based on configuration."""
     
@@ -33,17 +62,22 @@ class VectorStoreFactory:
         documents: Optional[List[Document]] = None
     ) -> VectorStore:
         """Create a vector store based on configuration."""
-        # Validate configuration first
-        cls._validate_config(config)
+        # Get the appropriate strategy and validate configuration with it first
+        strategy_class = cls._get_strategy_class(config)
+        strategy = strategy_class()
+        cls._validate_config(config, strategy)
         
-        # Get the appropriate strategy
-        strategy_class = cls._strategies.get(config.type)
-        if strategy_class is None:
-            raise ValueError(f"Unsupported vector store type: {config.type}")
+        # Delegate creation to the same strategy instance
+        vectorstore = strategy.create_vectorstore(config, embeddings, documents)
         
-        # Create strategy instance and delegate to it
-        strategy = strategy_class()
-        return strategy.create_vectorstore(config, embeddings, documents)
+        persist_directory = getattr(config, 'persist_directory', None)
+        if vectorstore is not None and persist_directory:
+            mtime = _persist_mtime(persist_directory)
+            if mtime is not None:
+                with _vs_cache_lock:
+                    _vs_cache[_cache_key(config)] = (strategy_class, embeddings, mtime, vectorstore)
+        
+        return vectorstore
     
     @classmethod
     def load_vectorstore(
@@ -57,20 +91,59 @@ class VectorStoreFactory:
         if strategy_class is None:
             return None
         
+        # Reuse the already-loaded store while nothing on disk has changed
+        persist_directory = getattr(config, 'persist_directory', None)
+        mtime = _persist_mtime(persist_directory) if persist_directory else None
+        if mtime is not None:
+            key = _cache_key(config)
+            with _vs_cache_lock:
+                cached = _vs_cache.get(key)
+            if (
+                cached is not None
+                and cached[0] is strategy_class
+                and cached[1] is embeddings
+                and cached[2] == mtime
+            ):
+                return cached[3]
+        
         # Create strategy instance and delegate to it
         strategy = strategy_class()
-        return strategy.load_vectorstore(config, embeddings)
+        vectorstore = strategy.load_vectorstore(config, embeddings)
+        
+        if mtime is not None:
+            with _vs_cache_lock:
+                if vectorstore is None:
+                    _vs_cache.pop(key, None)
+                else:
+                    _vs_cache[key] = (strategy_class, embeddings, mtime, vectorstore)
+        
+        return vectorstore
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached vector stores and shared Chroma clients."""
+        with _vs_cache_lock:
+            _vs_cache.clear()
+        clear_chroma_clients()
+    
+    @classmethod
+    def _validate_config(
+        cls,
+        config: VectorStoreConfig,
+        strategy: Optional[VectorStoreStrategy] = None
+    ) -> None:
+        """Validate configuration using the appropriate (or an already created) strategy."""
+        if strategy is None:
+            strategy = cls._get_strategy_class(config)()
+        strategy.validate_config(config)
     
     @classmethod
-    def _validate_config(cls, config: VectorStoreConfig) -> None:
-        """Validate configuration using the appropriate strategy."""
+    def _get_strategy_class(cls, config: VectorStoreConfig) -> Type[VectorStoreStrategy]:
+        """Look up the strategy class for a configuration's vector store type."""
         strategy_class = cls._strategies.get(config.type)
         if strategy_class is None:
             raise ValueError(f"Unsupported vector store type: {config.type}")
-        
-        # Create strategy instance and validate
-        strategy = strategy_class()
-        strategy.validate_config(config)
+        return strategy_class
     
     @classmethod
     def register_strategy(
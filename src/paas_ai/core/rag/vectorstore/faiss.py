@@ -2,20 +2,233 @@
 FAISS vector store strategy.
 """
 
-from typing import List, Optional
+import math
+import pickle
+import weakref
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 import faiss
 import numpy as np
 
-from .base import VectorStoreStrategy
+from .base import DEFAULT_EMBEDDING_BATCH_SIZE, VectorStoreStrategy, embed_in_batches
 from ...config.schemas import VectorStoreConfig
 
 
+FAISS_INDEX_TYPES = ("FLAT", "HNSW", "IVF_FLAT", "IVF_PQ")
+EMBEDDING_PRECISIONS = ("FP32", "FP16", "INT8")
+
+# Scalar quantizer used to store vectors at reduced precision; FP32 stores them as-is
+_SCALAR_QUANTIZER_TYPES = {
+    "FP16": faiss.ScalarQuantizer.QT_fp16,
+    "INT8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+# Index types FAISS can move to the GPU (scalar-quantized flat and HNSW cannot)
+_GPU_INDEX_TYPES = ("FLAT", "IVF_FLAT", "IVF_PQ")
+
+# Corpus sizes at which autotune moves off an exact flat index
+AUTOTUNE_IVF_THRESHOLD = 50_000
+AUTOTUNE_IVF_PQ_THRESHOLD = 1_000_000
+
+# FAISS params consumed by this strategy rather than forwarded to LangChain
+_INDEX_PARAM_KEYS = (
+    "mmap",
+    "autotune",
+    "faiss_index_type",
+    "hnsw_m",
+    "ef_construction",
+    "ef_search",
+    "nlist",
+    "pq_m",
+    "pq_nbits",
+    "nprobe",
+    "embedding_precision",
+    "embedding_batch_size",
+    "ingest_concurrency",
+    "use_gpu",
+)
+
+
+# Embedding dimension per live embeddings instance, keyed by id()
+_dimension_cache: Dict[int, int] = {}
+
+
+def _declared_dimension(embeddings: Embeddings) -> Optional[int]:
+    """Read the embedding dimension from the model without running it, if exposed."""
+    for attr in ("dimension", "dimensions"):
+        value = getattr(embeddings, attr, None)
+        if isinstance(value, int) and value > 0:
+            return value
+    
+    get_dimension = getattr(getattr(embeddings, "client", None), "get_sentence_embedding_dimension", None)
+    if callable(get_dimension):
+        value = get_dimension()
+        if isinstance(value, int) and value > 0:
+            return value
+    return None
+
+
+def _embedding_dimension(embeddings: Embeddings) -> int:
+    """Get the embedding dimension, probing the model at most once per instance."""
+    key = id(embeddings)
+    dimension = _dimension_cache.get(key)
+    if dimension is not None:
+        return dimension
+    
+    dimension = _declared_dimension(embeddings)
+    if dimension is None:
+        sample_text = "sample text for dimension calculation"
+        dimension = len(embeddings.embed_query(sample_text))
+    
+    try:
+        # Drop the entry when the instance goes away so a reused id() can't hit it
+        weakref.finalize(embeddings, _dimension_cache.pop, key, None)
+    except TypeError:
+        return dimension
+    _dimension_cache[key] = dimension
+    return dimension
+
+
+def _gpu_available() -> bool:
+    """Whether this FAISS build has GPU support and a GPU is visible."""
+    return hasattr(faiss, "StandardGpuResources") and faiss.get_num_gpus() > 0
+
+
+def _build_index(
+    index_type: str,
+    dimension: int,
+    index_params: dict,
+    training_vectors: Optional[np.ndarray] = None,
+    gpu_resources=None
+):
+    """
+    Build an empty (trained, if required) FAISS index of the given type.
+    
+    With gpu_resources the index is moved to GPU 0 before training, so both
+    training and later adds run there.
+    """
+    precision = str(index_params.get("embedding_precision", "FP32")).upper()
+    quantizer_type = _SCALAR_QUANTIZER_TYPES.get(precision)
+    
+    if index_type == "HNSW":
+        hnsw_m = index_params.get("hnsw_m", 32)
+        if quantizer_type is None:
+            index = faiss.IndexHNSWFlat(dimension, hnsw_m)
+        else:
+            index = faiss.IndexHNSWSQ(dimension, quantizer_type, hnsw_m)
+        index.hnsw.efConstruction = index_params.get("ef_construction", 200)
+        index.hnsw.efSearch = index_params.get("ef_search", 64)
+    elif index_type == "IVF_FLAT":
+        quantizer = faiss.IndexFlatL2(dimension)
+        nlist = index_params.get("nlist", 100)
+        if quantizer_type is None:
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist)
+        else:
+            index = faiss.IndexIVFScalarQuantizer(quantizer, dimension, nlist, quantizer_type)
+        index.nprobe = index_params.get("nprobe", 8)
+    elif index_type == "IVF_PQ":
+        quantizer = faiss.IndexFlatL2(dimension)
+        index = faiss.IndexIVFPQ(
+            quantizer,
+            dimension,
+            index_params.get("nlist", 100),
+            index_params.get("pq_m", 8),
+            index_params.get("pq_nbits", 8),
+        )
+        index.nprobe = index_params.get("nprobe", 8)
+    elif quantizer_type is None:
+        index = faiss.IndexFlatL2(dimension)
+    else:
+        index = faiss.IndexScalarQuantizer(dimension, quantizer_type)
+    
+    if gpu_resources is not None:
+        index = faiss.index_cpu_to_gpu(gpu_resources, 0, index)
+    
+    if not index.is_trained:
+        if training_vectors is None or len(training_vectors) == 0:
+            label = index_type if quantizer_type is None else f"{index_type} {precision}"
+            raise ValueError(f"{label} index requires documents to train on")
+        index.train(training_vectors)
+    return index
+
+
+def _autotune_index_params(index_params: dict, corpus_size: int) -> dict:
+    """
+    Fill in index type and search params from the corpus size.
+    
+    Explicitly configured params are kept as-is. Large corpora move to IVF
+    (PQ beyond a million vectors) with nlist ~ 4*sqrt(N) and nprobe = nlist/20;
+    HNSW gets efSearch scaled with log2(N).
+    """
+    tuned = dict(index_params)
+    if "faiss_index_type" not in tuned:
+        # PQ already compresses vectors, so reduced precision stays on IVF_FLAT
+        full_precision = str(tuned.get("embedding_precision", "FP32")).upper() == "FP32"
+        if corpus_size > AUTOTUNE_IVF_PQ_THRESHOLD and full_precision:
+            tuned["faiss_index_type"] = "IVF_PQ"
+        elif corpus_size > AUTOTUNE_IVF_THRESHOLD:
+            tuned["faiss_index_type"] = "IVF_FLAT"
+    
+    index_type = str(tuned.get("faiss_index_type", "FLAT")).upper()
+    if index_type in ("IVF_FLAT", "IVF_PQ"):
+        nlist = tuned.setdefault("nlist", max(1, int(4 * math.sqrt(corpus_size))))
+        tuned.setdefault("nprobe", max(1, nlist // 20))
+    elif index_type == "HNSW" and corpus_size > 1:
+        tuned.setdefault("ef_search", min(128, max(32, int(math.log2(corpus_size) * 8))))
+    return tuned
+
+
+def _embed_documents(
+    embeddings: Embeddings,
+    texts: List[str],
+    batch_size: int,
+    concurrency: int = 1
+) -> np.ndarray:
+    """Embed texts in fixed-size batches into a float32 matrix."""
+    return np.vstack([
+        np.asarray(vectors, dtype=np.float32)
+        for vectors in embed_in_batches(embeddings, texts, batch_size, concurrency)
+    ])
+
+
+# Map flat codes straight from the file instead of copying them onto the heap
+_MMAP_READ_FLAGS = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+
+
+class MemoryMappedFAISS(FAISS):
+    """
+    FAISS store whose index is memory-mapped read-only from disk.
+    
+    The OS pages the index in on demand and shares those pages between
+    processes. Adding to a mapped index would abort inside FAISS, so writes
+    raise instead; load the store without 'mmap' to modify it.
+    """
+    
+    def _read_only(self) -> None:
+        raise ValueError(
+            "FAISS index was loaded with mmap and is read-only; "
+            "load it without the 'mmap' param to add or delete documents"
+        )
+    
+    def add_texts(self, *args: Any, **kwargs: Any) -> List[str]:
+        self._read_only()
+    
+    def add_embeddings(self, *args: Any, **kwargs: Any) -> List[str]:
+        self._read_only()
+    
+    def delete(self, *args: Any, **kwargs: Any) -> Optional[bool]:
+        self._read_only()
+    
+    def merge_from(self, *args: Any, **kwargs: Any) -> None:
+        self._read_only()
+
+
 class FAISSVectorStoreStrategy(VectorStoreStrategy):
     """Strategy for FAISS vector stores."""
     
@@ -27,8 +240,41 @@ class FAISSVectorStoreStrategy(VectorStoreStrategy):
     ) -> VectorStore:
         """Create a FAISS vector store."""
         params = config.params.copy()
+        index_params = {key: params.pop(key) for key in _INDEX_PARAM_KEYS if key in params}
+        if documents and index_params.get("autotune"):
+            index_params = _autotune_index_params(index_params, len(documents))
+        index_type = str(index_params.get("faiss_index_type", "FLAT")).upper()
+        precision = str(index_params.get("embedding_precision", "FP32")).upper()
+        plain_index = index_type == "FLAT" and precision == "FP32"
+        concurrency = index_params.get("ingest_concurrency", 1)
+        use_gpu = index_params.get("use_gpu", False) and _gpu_available()
         
-        if documents:
+        if documents and (not plain_index or concurrency > 1 or use_gpu):
+            texts = [doc.page_content for doc in documents]
+            metadatas = [doc.metadata for doc in documents]
+            batch_size = index_params.get("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE)
+            vectors = _embed_documents(embeddings, texts, batch_size, concurrency)
+            # Flat indexes need about 4 * N * d bytes of VRAM on the GPU
+            gpu_resources = faiss.StandardGpuResources() if use_gpu else None
+            index = _build_index(index_type, vectors.shape[1], index_params, vectors, gpu_resources)
+            vectorstore = FAISS(
+                embedding_function=embeddings,
+                index=index,
+                docstore=InMemoryDocstore(),
+                index_to_docstore_id={},
+                **params
+            )
+            # Keep document ids, as FAISS.from_documents does, instead of random UUIDs
+            ids = [doc.id for doc in documents]
+            vectorstore.add_embeddings(
+                zip(texts, vectors.tolist()),
+                metadatas=metadatas,
+                ids=ids if any(ids) else None
+            )
+            if gpu_resources is not None:
+                # Copy the populated index back so it can be persisted and searched on CPU
+                vectorstore.index = faiss.index_gpu_to_cpu(vectorstore.index)
+        elif documents:
             vectorstore = FAISS.from_documents(
                 documents=documents,
                 embedding=embeddings,
@@ -36,17 +282,19 @@ class FAISSVectorStoreStrategy(VectorStoreStrategy):
             )
         else:
             # Create empty FAISS index
-            # Get embedding dimension
-            sample_text = "sample text for dimension calculation"
-            sample_embedding = embeddings.embed_query(sample_text)
-            dimension = len(sample_embedding)
+            dimension = _embedding_dimension(embeddings)
             
             # Create empty index
-            index = faiss.IndexFlatL2(dimension)
+            if plain_index:
+                index = faiss.IndexFlatL2(dimension)
+                docstore = {}
+            else:
+                index = _build_index(index_type, dimension, index_params)
+                docstore = InMemoryDocstore()
             vectorstore = FAISS(
                 embedding_function=embeddings,
                 index=index,
-                docstore={},
+                docstore=docstore,
                 index_to_docstore_id={}
             )
         
@@ -74,17 +322,74 @@ class FAISSVectorStoreStrategy(VectorStoreStrategy):
         
         try:
             params = config.params.copy()
-            return FAISS.load_local(
-                folder_path=str(persist_dir),
-                embeddings=embeddings,
-                **params
-            )
+            nprobe = params.get("nprobe")
+            mmap = params.get("mmap", False)
+            for key in _INDEX_PARAM_KEYS:
+                params.pop(key, None)
+            if mmap:
+                vectorstore = self._load_memory_mapped(persist_dir, embeddings, params)
+            else:
+                vectorstore = FAISS.load_local(
+                    folder_path=str(persist_dir),
+                    embeddings=embeddings,
+                    **params
+                )
+            if nprobe is not None and hasattr(vectorstore.index, "nprobe"):
+                vectorstore.index.nprobe = nprobe
+            return vectorstore
         except Exception:
             return None
     
+    def _load_memory_mapped(
+        self,
+        persist_dir: Path,
+        embeddings: Embeddings,
+        params: Dict[str, Any]
+    ) -> VectorStore:
+        """Load a store like FAISS.load_local, but with the index mapped read-only."""
+        # Same opt-in FAISS.load_local requires before unpickling the docstore
+        if not params.pop("allow_dangerous_deserialization", False):
+            raise ValueError("Loading the FAISS docstore requires allow_dangerous_deserialization")
+        index_name = params.pop("index_name", "index")
+        
+        index = faiss.read_index(str(persist_dir / f"{index_name}.faiss"), _MMAP_READ_FLAGS)
+        with open(persist_dir / f"{index_name}.pkl", "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        
+        return MemoryMappedFAISS(embeddings, index, docstore, index_to_docstore_id, **params)
+    
     def validate_config(self, config: VectorStoreConfig) -> None:
         """Validate FAISS vector store configuration."""
         # FAISS doesn't require collection_name, but we can validate other params
+        params = getattr(config, 'params', None) or {}
+        index_type = str(params.get("faiss_index_type", "FLAT")).upper()
+        if index_type not in FAISS_INDEX_TYPES:
+            raise ValueError(
+                f"Unsupported faiss_index_type: {index_type}. "
+                f"Supported types: {', '.join(FAISS_INDEX_TYPES)}"
+            )
+        
+        precision = str(params.get("embedding_precision", "FP32")).upper()
+        if precision not in EMBEDDING_PRECISIONS:
+            raise ValueError(
+                f"Unsupported embedding_precision: {precision}. "
+                f"Supported precisions: {', '.join(EMBEDDING_PRECISIONS)}"
+            )
+        if precision != "FP32" and index_type == "IVF_PQ":
+            raise ValueError("embedding_precision cannot be combined with IVF_PQ, which already compresses vectors")
+        concurrency = params.get("ingest_concurrency", 1)
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+            raise ValueError("ingest_concurrency must be a positive integer")
+        use_gpu = params.get("use_gpu", False)
+        if not isinstance(use_gpu, bool):
+            raise ValueError("use_gpu must be a boolean")
+        if use_gpu and (index_type not in _GPU_INDEX_TYPES or (index_type == "FLAT" and precision != "FP32")):
+            raise ValueError(f"use_gpu requires a FP32 FLAT, IVF_FLAT or IVF_PQ index, got {index_type} {precision}")
+        if not isinstance(params.get("autotune", False), bool):
+            raise ValueError("autotune must be a boolean")
+        if not isinstance(params.get("mmap", False), bool):
+            raise ValueError("mmap must be a boolean")
+        
         persist_directory = getattr(config, 'persist_directory', None)
         if persist_directory:
             persist_path = Path(persist_directory)
@@ -29,20 +29,18 @@ class PineconeVectorStoreStrategy(VectorStoreStrategy):
         if PineconeVectorStore is None:
             raise ImportError("Pinecone integration requires pinecone-client package")
         
-        params = config.params.copy()
-        
         if documents:
             return PineconeVectorStore.from_documents(
                 documents=documents,
                 embedding=embeddings,
                 index_name=config.collection_name,
-                **params
+                **config.params
             )
         else:
             return PineconeVectorStore(
                 embedding=embeddings,
                 index_name=config.collection_name,
-                **params
+                **config.params
             )
     
     def load_vectorstore(
@@ -55,11 +53,10 @@ class PineconeVectorStoreStrategy(VectorStoreStrategy):
             return None
         
         try:
-            params = config.params.copy()
             return PineconeVectorStore(
                 embedding=embeddings,
                 index_name=config.collection_name,
-                **params
+                **config.params
             )
         except Exception:
             return None
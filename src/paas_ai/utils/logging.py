@@ -16,21 +16,85 @@ Usage:
     from paas_ai.utils.logging import logger
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 import json
+import threading
 import traceback
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional, Union, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union, List
 from pathlib import Path
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 
-import colorama
-from colorama import Fore, Back, Style
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Initialize colorama for cross-platform color support
-colorama.init(autoreset=True)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class _Ansi:
+    """ANSI SGR escape codes for console colors."""
+    
+    BLACK = "\x1b[30m"
+    RED = "\x1b[31m"
+    GREEN = "\x1b[32m"
+    YELLOW = "\x1b[33m"
+    BLUE = "\x1b[34m"
+    MAGENTA = "\x1b[35m"
+    CYAN = "\x1b[36m"
+    BRIGHT = "\x1b[1m"
+    RESET = "\x1b[0m"
+
+
+_ansi_enabled = False
+
+
+def _enable_ansi() -> None:
+    """Make the console interpret ANSI codes, once; a no-op outside Windows."""
+    global _ansi_enabled
+    if _ansi_enabled:
+        return
+    _ansi_enabled = True
+    if sys.platform != "win32":
+        return
+    
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING, available since Windows 10
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and \
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004):
+            return
+    except (AttributeError, OSError):
+        pass
+    
+    # Older consoles need colorama to translate ANSI codes, if it is installed
+    try:
+        import colorama
+    except ImportError:
+        return
+    colorama.just_fix_windows_console()
+
+
+def _supports_color(stream) -> bool:
+    """Whether ANSI colors should be written to stream (a TTY, and NO_COLOR unset)."""
+    if os.environ.get("NO_COLOR"):
+        return False
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
 
 # Thread-safe context variable for logging context
 _log_context: ContextVar[Optional[str]] = ContextVar('log_context', default=None)
@@ -57,13 +121,38 @@ ALL_LOG_LEVELS = {**STANDARD_LOG_LEVELS, **CUSTOM_LOG_LEVELS}
 class LogLevel(Enum):
     """Log levels with associated colors and emojis."""
     
-    DEBUG = ("DEBUG", Fore.CYAN, "🔍")
-    INFO = ("INFO", Fore.GREEN, "ℹ️")
-    WARNING = ("WARNING", Fore.YELLOW, "⚠️")
-    ERROR = ("ERROR", Fore.RED, "❌")
-    CRITICAL = ("CRITICAL", Fore.MAGENTA + Style.BRIGHT, "💥")
-    SUCCESS = ("SUCCESS", Fore.GREEN + Style.BRIGHT, "✅")
-    PROGRESS = ("PROGRESS", Fore.BLUE, "⏳")
+    DEBUG = ("DEBUG", _Ansi.CYAN, "🔍")
+    INFO = ("INFO", _Ansi.GREEN, "ℹ️")
+    WARNING = ("WARNING", _Ansi.YELLOW, "⚠️")
+    ERROR = ("ERROR", _Ansi.RED, "❌")
+    CRITICAL = ("CRITICAL", _Ansi.MAGENTA + _Ansi.BRIGHT, "💥")
+    SUCCESS = ("SUCCESS", _Ansi.GREEN + _Ansi.BRIGHT, "✅")
+    PROGRESS = ("PROGRESS", _Ansi.BLUE, "⏳")
+
+
+@lru_cache(maxsize=4)
+def _format_second(seconds: int) -> Tuple[str, str]:
+    """Format a whole-second timestamp as (HH:MM:SS, ISO 8601); records share a second."""
+    moment = datetime.fromtimestamp(seconds)
+    return moment.strftime("%H:%M:%S"), moment.isoformat()
+
+
+def _isoformat(created: float) -> str:
+    """Format a record timestamp like datetime.fromtimestamp(created).isoformat()."""
+    seconds = int(created)
+    microseconds = round((created - seconds) * 1_000_000)
+    if microseconds >= 1_000_000:
+        return datetime.fromtimestamp(created).isoformat()
+    iso = _format_second(seconds)[1]
+    return f"{iso}.{microseconds:06d}" if microseconds else iso
+
+
+# (prefix, suffix) wrapped around timestamps and context in colored / plain output
+_DIM_RESET = (_Ansi.BLACK + _Ansi.BRIGHT, _Ansi.RESET)
+_PLAIN_RESET = ("", "")
+
+# Level name -> LogLevel, so formatters resolve a record's level with one lookup
+_LEVELS_BY_NAME: Dict[str, LogLevel] = {level.value[0]: level for level in LogLevel}
 
 
 class ColoredFormatter(logging.Formatter):
@@ -72,47 +161,38 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, use_colors: bool = True, use_emojis: bool = True):
         self.use_colors = use_colors
         self.use_emojis = use_emojis
+        # (level_name, use_colors, use_emojis) -> (emoji, level_part)
+        self._level_parts: Dict[tuple, tuple] = {}
         super().__init__()
     
+    def _get_level_parts(self, level_name: str) -> tuple:
+        """Get the emoji and padded (optionally colored) level name for a level."""
+        key = (level_name, self.use_colors, self.use_emojis)
+        parts = self._level_parts.get(key)
+        if parts is None:
+            record_level = _LEVELS_BY_NAME.get(level_name, LogLevel.INFO)
+            emoji = f"{record_level.value[2]} " if self.use_emojis else ""
+            if self.use_colors:
+                level_part = f"{record_level.value[1]}{level_name:<8}{_Ansi.RESET}"
+            else:
+                level_part = f"{level_name:<8}"
+            parts = self._level_parts[key] = (emoji, level_part)
+        return parts
+    
     def format(self, record: logging.LogRecord) -> str:
         # Get log level info
-        level_name =  record.levelname if not hasattr(record, 'custom_level') else record.custom_level.upper()
-
-        record_level = LogLevel.INFO
-        if self.use_colors or self.use_emojis:
-            for level in LogLevel:
-                if level.value[0] == level_name:
-                    record_level = level
-                    break
+        level_name = record.levelname if not hasattr(record, 'custom_level') else record.custom_level.upper()
+        emoji, level_part = self._get_level_parts(level_name)
 
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-        
-        # Add emoji, color, level_name and timestamp to the message
-        if self.use_emojis:
-            emoji = f"{record_level.value[2]} "
-        else:
-            emoji = ""
-
-        if self.use_colors:
-            color = record_level.value[1]
-            level_part = f"{color}{level_name:<8}{Style.RESET_ALL}"
-            time_part = f"{Fore.BLACK + Style.BRIGHT}{timestamp}{Style.RESET_ALL}"
-        else:
-            level_part = f"{level_name:<8}"
-            time_part = timestamp        
+        # Dim/reset codes, or empty strings so one template serves both modes
+        dim, reset = _DIM_RESET if self.use_colors else _PLAIN_RESET
+        timestamp = _format_second(int(record.created))[0]
         
         # Add context if available
-        context = ""
-        if hasattr(record, 'context') and record.context:
-            context_str = f"[{record.context}]"
-            if self.use_colors:
-                context = f" {Fore.BLACK + Style.BRIGHT}{context_str}{Style.RESET_ALL}"
-            else:
-                context = f" {context_str}"
+        context = getattr(record, 'context', None)
+        context_part = f" {dim}[{context}]{reset}" if context else ""
         
-        # Combine all parts
-        message = f"{emoji}{time_part} {level_part}{context} {record.getMessage()}"
+        message = f"{emoji}{dim}{timestamp}{reset} {level_part}{context_part} {record.getMessage()}"
         
         # Add exception info if present
         if record.exc_info:
@@ -121,12 +201,70 @@ class ColoredFormatter(logging.Formatter):
         return message
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a log entry or value, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    # Same compact, non-ASCII-preserving output as orjson
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+# Output encodings supported by JSONFormatter
+JSON_LOG_FORMATS = ("json", "ndjson", "msgpack")
+
+
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for structured logging in production."""
+    """
+    JSON formatter for structured logging in production.
     
-    def format(self, record: logging.LogRecord) -> str:
+    output_format selects the encoding: "json" serializes an entry dict,
+    "ndjson" writes the same object from a string template without building
+    the dict (records with extra fields or exceptions still use the dict),
+    and "msgpack" returns packed bytes for binary log files.
+    """
+    
+    def __init__(self, output_format: str = "json"):
+        if output_format not in JSON_LOG_FORMATS:
+            raise ValueError(f"Invalid log format: {output_format}. Valid formats are: {list(JSON_LOG_FORMATS)}")
+        if output_format == "msgpack" and msgpack is None:
+            raise ImportError("msgpack log format requires the msgpack package")
+        super().__init__()
+        self.output_format = output_format
+        # Pick the encoder once rather than branching on every record
+        self._encode = {
+            "json": self._encode_json,
+            "ndjson": self._encode_ndjson,
+            "msgpack": self._encode_msgpack,
+        }[output_format]
+    
+    def format(self, record: logging.LogRecord) -> Union[str, bytes]:
+        return self._encode(record)
+    
+    def _encode_json(self, record: logging.LogRecord) -> str:
+        return _dumps(self._build_entry(record))
+    
+    def _encode_msgpack(self, record: logging.LogRecord) -> bytes:
+        return msgpack.packb(self._build_entry(record), default=str)
+    
+    def _encode_ndjson(self, record: logging.LogRecord) -> str:
+        if record.exc_info or hasattr(record, 'extra_fields'):
+            return self._encode_json(record)
+        
+        dumps = _dumps
+        context = f',"context":{dumps(record.context)}' if hasattr(record, 'context') else ""
+        return (
+            f'{{"timestamp":"{_isoformat(record.created)}","level":{dumps(record.levelname)},'
+            f'"message":{dumps(record.getMessage())},"module":{dumps(record.module)},'
+            f'"function":{dumps(record.funcName)},"line":{record.lineno}{context}}}'
+        )
+    
+    def _build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the log entry dict for a record."""
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _isoformat(record.created),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -151,7 +289,7 @@ class JSONFormatter(logging.Formatter):
                 "traceback": self._format_traceback_lines(exc_traceback)
             }
         
-        return json.dumps(log_entry)
+        return log_entry
     
     def _format_traceback_lines(self, tb) -> List[str]:
         """Format traceback as an array of lines for better log aggregation, preserving indentation."""
@@ -174,13 +312,68 @@ class JSONFormatter(logging.Formatter):
             return [str(tb)]
 
 
+# One background writer per log file, shared by every logger writing to it
+_file_listeners: Dict[Path, QueueListener] = {}
+_file_listeners_lock = threading.Lock()
+
+
+class _BinaryFileHandler(logging.FileHandler):
+    """File handler appending records pre-encoded as bytes (e.g. msgpack, which is self-delimiting)."""
+    
+    def __init__(self, filename):
+        super().__init__(filename, mode="ab")
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(record.msg)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _get_file_queue(file_output: Path, binary: bool = False) -> queue.Queue:
+    """
+    Get the queue feeding the background writer for a log file, starting it if needed.
+    
+    The first logger to open a file decides whether it is written as text or bytes.
+    """
+    key = Path(file_output).resolve()
+    with _file_listeners_lock:
+        listener = _file_listeners.get(key)
+        if listener is None:
+            if binary:
+                file_handler = _BinaryFileHandler(file_output)
+            else:
+                file_handler = logging.FileHandler(file_output)
+                # Records arrive already rendered to JSON by the QueueHandler
+                file_handler.setFormatter(logging.Formatter("%(message)s"))
+            listener = QueueListener(queue.Queue(-1), file_handler)
+            listener.start()
+            _file_listeners[key] = listener
+    return listener.queue
+
+
+def _stop_file_listeners() -> None:
+    """Write out pending records and stop all background log writers."""
+    with _file_listeners_lock:
+        listeners = list(_file_listeners.values())
+        _file_listeners.clear()
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_file_listeners)
+
+
 class PaaSLogger:
     """
     Enhanced logger for PaaS AI with context support and custom levels.
     
     Features:
     - Color-coded console output
-    - JSON structured logging for files
+    - JSON structured logging for files, written by a background thread
     - Thread-safe context-aware logging using contextvars
     - Custom log levels (SUCCESS, PROGRESS)
     - Easy configuration for different environments
@@ -195,6 +388,7 @@ class PaaSLogger:
         json_format: bool = False,
         use_colors: bool = True,
         use_emojis: bool = True,
+        file_format: str = "json",
     ):
         self.logger = logging.getLogger(name)
         
@@ -220,15 +414,18 @@ class PaaSLogger:
             if json_format:
                 console_handler.setFormatter(JSONFormatter())
             else:
+                if use_colors:
+                    _enable_ansi()
                 console_handler.setFormatter(
                     ColoredFormatter(use_colors=use_colors, use_emojis=use_emojis)
                 )
             self.logger.addHandler(console_handler)
         
-        # File handler
+        # File handler: records are formatted here and written by a background thread
         if file_output:
-            file_handler = logging.FileHandler(file_output)
-            file_handler.setFormatter(JSONFormatter())
+            file_formatter = JSONFormatter(file_format)
+            file_handler = QueueHandler(_get_file_queue(file_output, binary=file_format == "msgpack"))
+            file_handler.setFormatter(file_formatter)
             self.logger.addHandler(file_handler)
     
     def _add_custom_levels(self):
@@ -238,6 +435,14 @@ class PaaSLogger:
         # Add PROGRESS level  
         logging.addLevelName(15, "PROGRESS")
     
+    def flush(self):
+        """Block until queued file log records have been written."""
+        with _file_listeners_lock:
+            live_queues = {id(listener.queue) for listener in _file_listeners.values()}
+        for handler in self.logger.handlers:
+            if isinstance(handler, QueueHandler) and id(handler.queue) in live_queues:
+                handler.queue.join()
+    
     def set_context(self, context: str):
         """Set context for subsequent log messages in the current context."""
         _log_context.set(context)
@@ -252,6 +457,10 @@ class PaaSLogger:
     
     def _log_with_context(self, level: int, message: str, extra: Optional[Dict] = None, **kwargs):
         """Log with context and extra fields."""
+        # Skip building extras for records the logger would discard anyway
+        if not self.logger.isEnabledFor(level):
+            return
+        
         record_extra = dict(extra) if extra else {}
         
         # Get context from contextvar (thread-safe)
@@ -308,6 +517,7 @@ def get_logger(
     json_format: bool = False,
     colors: bool = True,
     emojis: bool = True,
+    file_format: str = "json",
 ) -> PaaSLogger:
     """
     Get a configured PaaS logger instance.
@@ -321,8 +531,9 @@ def get_logger(
         console: Enable console output
         file_path: Optional file path for logging
         json_format: Use JSON format (for production)
-        colors: Enable colored output
+        colors: Enable colored output (ignored when stdout is not a TTY or NO_COLOR is set)
         emojis: Enable emoji indicators
+        file_format: File log encoding: "json", "ndjson" or "msgpack" (requires msgpack)
     
     Returns:
         Configured PaaSLogger instance
@@ -333,6 +544,8 @@ def get_logger(
         >>> logger.info("This is a test message")
     """
     file_output = Path(file_path) if file_path else None
+    # Redirected output (pipes, container logs) gets plain text
+    colors = colors and _supports_color(sys.stdout)
     
     return PaaSLogger(
         name=name,
@@ -342,6 +555,7 @@ def get_logger(
         json_format=json_format,
         use_colors=colors,
         use_emojis=emojis,
+        file_format=file_format,
     )
 
 
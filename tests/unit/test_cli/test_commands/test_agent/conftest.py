@@ -0,0 +1,106 @@
+"""
+Shared fixtures for agent command tests.
+"""
+
+import copy
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from src.paas_ai.core.agents.multi_agent_system import MultiAgentSystem
+
+# Summary returned by the stub agent's get_config_summary()
+DEFAULT_SUMMARY = {
+    "llm": {"provider": "openai", "model": "gpt-3.5-turbo"},
+    "embedding": {"type": "openai", "model": "text-embedding-3-small"},
+    "vectorstore": {"type": "chroma", "directory": "/tmp/chroma", "collection": "test"},
+    "multi_agent": {
+        "mode": "supervisor",
+        "agents": ["designer"],
+        "track_tokens": True,
+        "verbose": False,
+    },
+}
+
+
+def make_config(track_tokens=False, verbose=False):
+    """Build a config stub exposing only the fields the agent commands read."""
+    return SimpleNamespace(
+        embedding=SimpleNamespace(type="openai"),
+        multi_agent=SimpleNamespace(track_tokens=track_tokens, verbose=verbose),
+    )
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Click test runner shared across a module; it keeps no state between invokes."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_config():
+    """Config stub with token tracking and verbose output disabled."""
+    return make_config()
+
+
+@pytest.fixture
+def make_summary():
+    """Build copies of DEFAULT_SUMMARY with multi_agent fields overridden."""
+
+    def _make_summary(**multi_agent):
+        summary = copy.deepcopy(DEFAULT_SUMMARY)
+        summary["multi_agent"].update(multi_agent)
+        return summary
+
+    return _make_summary
+
+
+@pytest.fixture
+def mock_agent():
+    """MultiAgentSystem stub answering "Response" with no tools or token usage."""
+    agent = Mock(spec=MultiAgentSystem)
+    agent.config = make_config()
+    agent.chat_stream.return_value = ("Response",)
+    agent.chat.return_value = "Response"
+    agent.get_available_tools.return_value = []
+    agent.get_config_summary.return_value = DEFAULT_SUMMARY
+    agent.get_token_session_summary.return_value = {"total_tokens": 0}
+    return agent
+
+
+@pytest.fixture(scope="module")
+def agent_module():
+    """The agent command package, resolved once for module-structure tests."""
+    import src.paas_ai.cli.commands.agent as agent
+
+    return agent
+
+
+@pytest.fixture(scope="module")
+def chat_module():
+    """The chat command module, resolved once so patches need no import-path lookups."""
+    import src.paas_ai.cli.commands.agent.chat as chat
+
+    return chat
+
+
+@pytest.fixture
+def chat_mocks(chat_module, monkeypatch, mock_config, mock_agent):
+    """Replace load_config and MultiAgentSystem in the chat module with the shared stubs."""
+    mocks = {
+        "load_config": Mock(return_value=mock_config),
+        "MultiAgentSystem": Mock(return_value=mock_agent),
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(chat_module, name, mock)
+    return mocks
+
+
+@pytest.fixture
+def mock_prompt(chat_module, monkeypatch):
+    """Patch click.prompt for tests that drive the chat loop without a CliRunner."""
+    prompt = Mock()
+    monkeypatch.setattr(chat_module.click, "prompt", prompt)
+    return prompt
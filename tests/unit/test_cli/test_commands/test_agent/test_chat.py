@@ -10,16 +10,42 @@ Tests all components of the chat command including:
 - Configuration display and management
 """
 
+import re
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
-from click.testing import CliRunner
 from langchain_core.messages import AIMessage, HumanMessage
 
-from src.paas_ai.cli.commands.agent.chat import _stream_response, chat_command
+from src.paas_ai.cli.commands.agent.chat import _run_chat_loop, _stream_response, chat_command
 from src.paas_ai.core.config import ConfigurationError
 from src.paas_ai.core.config.schemas import DEFAULT_CONFIG_PROFILES
 
+# Expected chat output lines
+_MSG_BANNER = "🤖 MULTI-AGENT INTERACTIVE CHAT SESSION"
+_MSG_GOODBYE = "👋 Thanks for chatting! Goodbye!"
+_MSG_INTERRUPT = "👋 Session interrupted. Goodbye!"
+_MSG_FALLBACK = "⚠️ Streaming failed, falling back to standard mode"
+_MSG_TOOLS = "🔧 AVAILABLE TOOLS:"
+_MSG_CURRENT_CONFIG = "⚙️  CURRENT CONFIGURATION:"
+
+# Messages passed to _stream_response; the agent stub never mutates them
+_HUMAN_HELLO = HumanMessage(content="Hello")
+_HUMAN_QUESTION = HumanMessage(content="Test question")
+
+# Lines --show-config prints for the shared DEFAULT_SUMMARY
+_CFG_EXPECTED = (
+    "CONFIGURATION SUMMARY:",
+    "LLM: openai (gpt-3.5-turbo)",
+    "Multi-Agent Mode: supervisor",
+)
+
+# Token usage lines, in the order the 'tokens' command prints them
+_TOKENS_PATTERN = re.compile(
+    r"🪙 TOKEN USAGE SUMMARY:.*Total Tokens: 150.*Input Tokens: 100.*Output Tokens: 50"
+    r".*Total Requests: 2.*Session Duration: 5\.5s",
+    re.S,
+)
+
 
 class TestStreamResponse:
     """Test the _stream_response helper function."""
@@ -27,9 +53,9 @@ class TestStreamResponse:
     def test_stream_response_with_messages(self):
         """Test streaming response with messages."""
         mock_agent = Mock()
-        mock_agent.chat_stream.return_value = ["Chat", " response"]
+        mock_agent.chat_stream.return_value = ("Chat", " response")
 
-        messages = [HumanMessage(content="Hello")]
+        messages = [_HUMAN_HELLO]
         result = _stream_response(mock_agent, messages)
 
         assert result == "Chat response"
@@ -38,9 +64,9 @@ class TestStreamResponse:
     def test_stream_response_with_debug_mode(self):
         """Test streaming response with debug mode."""
         mock_agent = Mock()
-        mock_agent.chat_stream.return_value = ["Debug", " response"]
+        mock_agent.chat_stream.return_value = ("Debug", " response")
 
-        messages = [HumanMessage(content="Test question")]
+        messages = [_HUMAN_QUESTION]
         result = _stream_response(mock_agent, messages, debug=True)
 
         assert result == "Debug response"
@@ -49,9 +75,9 @@ class TestStreamResponse:
     def test_stream_response_with_error_token(self):
         """Test streaming response with error token."""
         mock_agent = Mock()
-        mock_agent.chat_stream.return_value = ["\n❌ Error occurred"]
+        mock_agent.chat_stream.return_value = ("\n❌ Error occurred",)
 
-        messages = [HumanMessage(content="Test question")]
+        messages = [_HUMAN_QUESTION]
         result = _stream_response(mock_agent, messages)
 
         assert result == "\n❌ Error occurred"
@@ -61,7 +87,7 @@ class TestStreamResponse:
         mock_agent = Mock()
         mock_agent.chat_stream.side_effect = Exception("Streaming error")
 
-        messages = [HumanMessage(content="Test question")]
+        messages = [_HUMAN_QUESTION]
         with pytest.raises(Exception, match="Streaming error"):
             _stream_response(mock_agent, messages)
 
@@ -76,792 +102,394 @@ class TestStreamResponse:
 class TestChatCommand:
     """Test the chat_command function."""
 
-    def test_chat_command_basic_success(self):
+    def test_chat_command_basic_success(self, runner, mock_agent, chat_mocks):
         """Test basic successful chat command execution."""
-        runner = CliRunner()
+        # Setup mocks
+        mock_agent.chat_stream.return_value = ("Hello", " world")
+        mock_agent.chat.return_value = "Hello world"
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
+        # User input and exit
+        user_input = "Hello\nexit\n"
 
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Hello", " world"]
-            mock_agent.chat.return_value = "Hello world"
-            mock_multi_agent_class.return_value = mock_agent
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Mock user input and exit
-            mock_prompt.side_effect = ["Hello", "exit"]
+        # Verify
+        assert result.exit_code == 0
+        assert _MSG_BANNER in result.output
+        assert "Hello world" in result.output
+        assert _MSG_GOODBYE in result.output
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "🤖 MULTI-AGENT INTERACTIVE CHAT SESSION" in result.output
-            assert "Hello world" in result.output
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
-
-    def test_chat_command_with_show_config(self):
+    def test_chat_command_with_show_config(self, runner, mock_agent, chat_mocks):
         """Test chat command with --show-config flag."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.chat.return_value = "Response"
-            mock_agent.get_config_summary.return_value = {
-                "llm": {"provider": "openai", "model": "gpt-3.5-turbo"},
-                "embedding": {"type": "openai", "model": "text-embedding-3-small"},
-                "vectorstore": {"type": "chroma", "directory": "/tmp/chroma", "collection": "test"},
-                "multi_agent": {
-                    "mode": "supervisor",
-                    "agents": ["designer"],
-                    "track_tokens": True,
-                    "verbose": False,
-                },
-            }
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock user input and exit
-            mock_prompt.side_effect = ["exit"]
+        # User input and exit
+        user_input = "exit\n"
 
-            # Run command
-            result = runner.invoke(chat_command, ["--show-config"])
+        # Run command
+        result = runner.invoke(chat_command, ["--show-config"], input=user_input)
 
-            # Verify
-            assert result.exit_code == 0
-            assert "CONFIGURATION SUMMARY:" in result.output
-            assert "LLM: openai (gpt-3.5-turbo)" in result.output
-            assert "Multi-Agent Mode: supervisor" in result.output
+        # Verify
+        assert result.exit_code == 0
+        assert all(line in result.output for line in _CFG_EXPECTED)
 
-    def test_chat_command_with_config_profile(self):
+    def test_chat_command_with_config_profile(self, runner, mock_agent, chat_mocks):
         """Test chat command with --config-profile option."""
-        runner = CliRunner()
+        # User input and exit
+        user_input = "exit\n"
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "sentence_transformers"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.chat.return_value = "Response"
-            mock_multi_agent_class.return_value = mock_agent
+        # Run command
+        result = runner.invoke(chat_command, ["--config-profile", "local"], input=user_input)
 
-            # Mock user input and exit
-            mock_prompt.side_effect = ["exit"]
-
-            # Run command
-            result = runner.invoke(chat_command, ["--config-profile", "local"])
+        # Verify
+        assert result.exit_code == 0
+        assert _MSG_BANNER in result.output
+        # Built-in profiles are used as-is, without loading or copying a config
+        chat_mocks["load_config"].assert_not_called()
+        chat_mocks["MultiAgentSystem"].assert_called_once_with(DEFAULT_CONFIG_PROFILES["local"])
 
-            # Verify
-            assert result.exit_code == 0
-            assert "🤖 MULTI-AGENT INTERACTIVE CHAT SESSION" in result.output
-
-    def test_chat_command_with_thread_id(self):
+    def test_chat_command_with_thread_id(self, runner, mock_agent, chat_mocks):
         """Test chat command with --thread-id option."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
+        # User input and exit
+        user_input = "exit\n"
 
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.chat.return_value = "Response"
-            mock_multi_agent_class.return_value = mock_agent
+        # Run command
+        result = runner.invoke(chat_command, ["--thread-id", "test123"], input=user_input)
 
-            # Mock user input and exit
-            mock_prompt.side_effect = ["exit"]
+        # Verify
+        assert result.exit_code == 0
+        assert "Thread: test123" in result.output
 
-            # Run command
-            result = runner.invoke(chat_command, ["--thread-id", "test123"])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "Thread: test123" in result.output
-
-    def test_chat_command_session_info(self):
+    def test_chat_command_session_info(self, runner, mock_agent, chat_mocks):
         """Test chat command shows session info."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
+        # User input then exit
+        user_input = "test\nexit\n"
 
-            # Mock user input then exit
-            mock_prompt.side_effect = ["test", "exit"]
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "📝 Starting new conversation" in result.output
+        # Verify
+        assert result.exit_code == 0
+        assert "📝 Starting new conversation" in result.output
 
-    def test_chat_command_new_session(self):
+    def test_chat_command_new_session(self, runner, mock_agent, chat_mocks):
         """Test chat command starts new conversation with LangGraph persistence."""
-        runner = CliRunner()
+        # User input then exit
+        user_input = "test\nexit\n"
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Mock user input then exit
-            mock_prompt.side_effect = ["test", "exit"]
+        # Verify
+        assert result.exit_code == 0
+        assert "MULTI-AGENT INTERACTIVE CHAT SESSION" in result.output
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "MULTI-AGENT INTERACTIVE CHAT SESSION" in result.output
-
-    def test_chat_command_tools_command(self):
+    def test_chat_command_tools_command(self, mock_agent, mock_prompt, capsys):
         """Test chat command tools special command."""
-        runner = CliRunner()
+        # Setup mocks
+        mock_agent.get_available_tools.return_value = [
+            {
+                "name": "test_tool",
+                "description": "A test tool",
+                "args_schema": {"required": ["param1"]},
+            }
+        ]
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.get_available_tools.return_value = [
-                {
-                    "name": "test_tool",
-                    "description": "A test tool",
-                    "args_schema": {"required": ["param1"]},
-                }
-            ]
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock user input: tools command then exit
-            mock_prompt.side_effect = ["tools", "exit"]
+        # Mock user input: tools command then exit
+        mock_prompt.side_effect = ("tools", "exit")
 
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Verify
-            assert result.exit_code == 0
-            assert "🔧 AVAILABLE TOOLS:" in result.output
-            assert "test_tool" in result.output
-            assert "A test tool" in result.output
-            assert "Required: param1" in result.output
+        # Verify
+        assert exchanges == 0
+        assert _MSG_TOOLS in output
+        assert "test_tool" in output
+        assert "A test tool" in output
+        assert "Required: param1" in output
 
-    def test_chat_command_config_command(self):
+    def test_chat_command_config_command(self, mock_agent, mock_prompt, capsys):
         """Test chat command config special command."""
-        runner = CliRunner()
+        # Mock user input: config command then exit
+        mock_prompt.side_effect = ("config", "exit")
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.get_config_summary.return_value = {
-                "llm": {"provider": "openai", "model": "gpt-3.5-turbo"},
-                "embedding": {"type": "openai", "model": "text-embedding-3-small"},
-                "vectorstore": {"type": "chroma", "directory": "/tmp/chroma", "collection": "test"},
-                "multi_agent": {
-                    "mode": "single",
-                    "agents": ["rag_agent"],
-                    "track_tokens": False,
-                    "verbose": False,
-                },
-            }
-            mock_multi_agent_class.return_value = mock_agent
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Mock user input: config command then exit
-            mock_prompt.side_effect = ["config", "exit"]
+        # Verify
+        assert exchanges == 0
+        assert _MSG_CURRENT_CONFIG in output
+        assert "LLM: openai (gpt-3.5-turbo)" in output
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "⚙️  CURRENT CONFIGURATION:" in result.output
-            assert "LLM: openai (gpt-3.5-turbo)" in result.output
-
-    def test_chat_command_tokens_command_with_tracking(self):
+    def test_chat_command_tokens_command_with_tracking(
+        self, mock_agent, mock_config, mock_prompt, capsys
+    ):
         """Test chat command tokens special command with token tracking enabled."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = True
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.get_token_session_summary.return_value = {
-                "total_tokens": 150,
-                "total_input_tokens": 100,
-                "total_output_tokens": 50,
-                "total_requests": 2,
-                "session_duration": 5.5,
-                "agent_breakdown": {"designer": {"total_tokens": 150, "requests": 2}},
-                "model_breakdown": {"gpt-3.5-turbo": {"total_tokens": 150, "requests": 2}},
-            }
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock user input: tokens command then exit
-            mock_prompt.side_effect = ["tokens", "exit"]
-
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "🪙 TOKEN USAGE SUMMARY:" in result.output
-            assert "Total Tokens: 150" in result.output
-            assert "Input Tokens: 100" in result.output
-            assert "Output Tokens: 50" in result.output
-            assert "Total Requests: 2" in result.output
-            assert "Session Duration: 5.5s" in result.output
-
-    def test_chat_command_tokens_command_without_tracking(self):
+        # Setup mocks
+        mock_config.multi_agent.track_tokens = True
+        mock_agent.config = mock_config
+
+        mock_agent.get_token_session_summary.return_value = {
+            "total_tokens": 150,
+            "total_input_tokens": 100,
+            "total_output_tokens": 50,
+            "total_requests": 2,
+            "session_duration": 5.5,
+            "agent_breakdown": {"designer": {"total_tokens": 150, "requests": 2}},
+            "model_breakdown": {"gpt-3.5-turbo": {"total_tokens": 150, "requests": 2}},
+        }
+
+        # Mock user input: tokens command then exit
+        mock_prompt.side_effect = ("tokens", "exit")
+
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
+
+        # Verify
+        assert exchanges == 0
+        assert _TOKENS_PATTERN.search(output)
+
+    def test_chat_command_tokens_command_without_tracking(
+        self, mock_agent, mock_config, mock_prompt, capsys
+    ):
         """Test chat command tokens special command without token tracking."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.config = mock_config
-            mock_multi_agent_class.return_value = mock_agent
+        # Setup mocks
+        mock_agent.config = mock_config
 
-            # Mock user input: tokens command then exit
-            mock_prompt.side_effect = ["tokens", "exit"]
+        # Mock user input: tokens command then exit
+        mock_prompt.side_effect = ("tokens", "exit")
 
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Verify
-            assert result.exit_code == 0
-            assert "🪙 Token tracking is not enabled." in result.output
+        # Verify
+        assert exchanges == 0
+        assert "🪙 Token tracking is not enabled." in output
 
-    def test_chat_command_exit_variations(self):
+    @pytest.mark.parametrize("exit_cmd", ["exit", "quit", "bye"])
+    def test_chat_command_exit_variations(self, runner, mock_agent, chat_mocks, exit_cmd):
         """Test chat command with different exit commands."""
-        exit_commands = ["exit", "quit", "bye"]
-
-        for exit_cmd in exit_commands:
-            runner = CliRunner()
-
-            with patch(
-                "src.paas_ai.cli.commands.agent.chat.load_config"
-            ) as mock_load_config, patch(
-                "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-            ) as mock_multi_agent_class, patch(
-                "src.paas_ai.cli.commands.agent.chat.click.prompt"
-            ) as mock_prompt:
-                # Setup mocks
-                mock_config = Mock()
-                mock_config.embedding.type = "openai"
-                mock_config.multi_agent.track_tokens = False
-                mock_config.multi_agent.verbose = False
-                mock_load_config.return_value = mock_config
-
-                mock_agent = Mock()
-                mock_multi_agent_class.return_value = mock_agent
-
-                # Mock user input: exit command
-                mock_prompt.side_effect = [exit_cmd]
-
-                # Run command
-                result = runner.invoke(chat_command, [])
-
-                # Verify
-                assert result.exit_code == 0
-                assert "👋 Thanks for chatting! Goodbye!" in result.output
-
-    def test_chat_command_configuration_error(self):
-        """Test chat command with configuration error."""
-        runner = CliRunner()
+        # User input: exit command
+        user_input = f"{exit_cmd}\n"
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config:
-            # Setup mock to raise configuration error
-            mock_load_config.side_effect = ConfigurationError("Config file not found")
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Verify
+        assert result.exit_code == 0
+        assert _MSG_GOODBYE in result.output
 
-            # Verify
-            assert result.exit_code == 0  # Command should handle error gracefully
-            # The ConfigurationError is being caught by the general exception handler
-            # so we expect the "Failed to start chat" message instead
-            assert "❌ Failed to start chat: Config file not found" in result.output
+    def test_chat_command_configuration_error(self, runner, chat_mocks):
+        """Test chat command with configuration error."""
+        # Setup mock to raise configuration error
+        chat_mocks["load_config"].side_effect = ConfigurationError("Config file not found")
 
-    def test_chat_command_agent_error(self):
-        """Test chat command with agent processing error."""
-        runner = CliRunner()
+        # Run command
+        result = runner.invoke(chat_command, [])
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
+        # Verify
+        assert result.exit_code == 0  # Command should handle error gracefully
+        # The ConfigurationError is being caught by the general exception handler
+        # so we expect the "Failed to start chat" message instead
+        assert "❌ Failed to start chat: Config file not found" in result.output
 
-            mock_agent = Mock()
-            mock_agent.chat_stream.side_effect = Exception("Agent processing error")
-            mock_multi_agent_class.return_value = mock_agent
+    def test_chat_command_agent_error(self, runner, mock_agent, chat_mocks):
+        """Test chat command with agent processing error."""
+        # Setup mocks
+        mock_agent.chat_stream.side_effect = Exception("Agent processing error")
 
-            # Mock user input: question then exit
-            mock_prompt.side_effect = ["Test question", "exit"]
+        # User input: question then exit
+        user_input = "Test question\nexit\n"
 
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Verify
-            assert result.exit_code == 0
-            # Should handle error gracefully and continue
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
+        # Verify
+        assert result.exit_code == 0
+        # Should handle error gracefully and continue
+        assert _MSG_GOODBYE in result.output
 
 
 class TestChatCommandEdgeCases:
     """Test edge cases for chat command."""
 
-    def test_chat_command_empty_input(self):
+    def test_chat_command_empty_input(self, mock_agent, mock_prompt, capsys):
         """Test chat command with empty user input."""
-        runner = CliRunner()
+        # Mock user input: empty string then exit
+        mock_prompt.side_effect = ("", "exit")
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_multi_agent_class.return_value = mock_agent
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Mock user input: empty string then exit
-            mock_prompt.side_effect = ["", "exit"]
+        # Verify
+        assert exchanges == 0
+        # Should skip empty input and continue
+        assert _MSG_GOODBYE in output
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            # Should skip empty input and continue
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
-
-    def test_chat_command_whitespace_input(self):
+    def test_chat_command_whitespace_input(self, mock_agent, mock_prompt, capsys):
         """Test chat command with whitespace-only input."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
+        # Mock user input: whitespace then exit
+        mock_prompt.side_effect = ("   ", "exit")
 
-            mock_agent = Mock()
-            mock_multi_agent_class.return_value = mock_agent
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Mock user input: whitespace then exit
-            mock_prompt.side_effect = ["   ", "exit"]
+        # Verify
+        assert exchanges == 0
+        # Should skip whitespace input and continue
+        assert _MSG_GOODBYE in output
 
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            # Should skip whitespace input and continue
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
-
-    def test_chat_command_keyboard_interrupt(self):
+    def test_chat_command_keyboard_interrupt(self, mock_agent, mock_prompt, capsys):
         """Test chat command with keyboard interrupt."""
-        runner = CliRunner()
+        # Mock user input: keyboard interrupt
+        mock_prompt.side_effect = KeyboardInterrupt()
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_multi_agent_class.return_value = mock_agent
+        # Run the prompt loop directly
+        exchanges = _run_chat_loop(mock_agent, "test-thread")
+        output = capsys.readouterr().out
 
-            # Mock user input: keyboard interrupt
-            mock_prompt.side_effect = KeyboardInterrupt()
-
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Verify
+        assert exchanges == 0
+        assert _MSG_INTERRUPT in output
 
-            # Verify
-            assert result.exit_code == 0
-            assert "👋 Session interrupted. Goodbye!" in result.output
-
-    def test_chat_command_streaming_fallback(self):
+    def test_chat_command_streaming_fallback(self, runner, mock_agent, chat_module, chat_mocks):
         """Test chat command with streaming fallback to non-streaming."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt, patch(
-            "src.paas_ai.cli.commands.agent.chat._stream_response"
-        ) as mock_stream_response:
+        with patch.object(chat_module, "_stream_response") as mock_stream_response:
             # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.ask.return_value = "Fallback response"
             mock_agent.chat.return_value = "Fallback response"
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
 
             # Mock streaming to fail
             mock_stream_response.side_effect = Exception("Streaming failed")
 
-            # Mock user input: question then exit
-            mock_prompt.side_effect = ["Test question", "exit"]
+            # User input: question then exit
+            user_input = "Test question\nexit\n"
 
             # Run command
-            result = runner.invoke(chat_command, [])
+            result = runner.invoke(chat_command, [], input=user_input)
 
             # Verify
             assert result.exit_code == 0
-            assert "⚠️ Streaming failed, falling back to standard mode" in result.output
+            assert _MSG_FALLBACK in result.output
             assert "Fallback response" in result.output
 
-    def test_chat_command_multiple_exchanges(self):
+    def test_chat_command_multiple_exchanges(self, runner, mock_agent, chat_mocks):
         """Test chat command with multiple exchanges using LangGraph persistence."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            # Mock all the streaming methods to return proper string responses
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.chat.return_value = "Response"
-            # Mock other methods that might be called
-            mock_agent.get_config_summary.return_value = {
-                "llm": {"provider": "test", "model": "test"},
-                "embedding": {"type": "openai", "model": "test"},
-                "vectorstore": {"type": "test", "directory": "test", "collection": "test"},
-                "multi_agent": {
-                    "mode": "single",
-                    "agents": ["rag_agent"],
-                    "track_tokens": False,
-                    "verbose": False,
-                },
-            }
-            mock_agent.get_available_tools.return_value = []
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
+        # Multiple user inputs
+        user_input = "Question1\nQuestion2\nQuestion3\nexit\n"
 
-            # Mock multiple user inputs
-            mock_prompt.side_effect = ["Question1", "Question2", "Question3", "exit"]
-
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Verify
-            assert result.exit_code == 0
-            assert "💬 Exchanges in session:" in result.output
+        # Verify
+        assert result.exit_code == 0
+        assert "💬 Exchanges in session:" in result.output
 
-    def test_chat_command_with_verbose_token_tracking(self):
+    def test_chat_command_with_verbose_token_tracking(
+        self, runner, mock_agent, mock_config, chat_mocks
+    ):
         """Test chat command with verbose mode and token tracking."""
-        runner = CliRunner()
+        # Setup mocks
+        mock_config.multi_agent.track_tokens = True
+        mock_config.multi_agent.verbose = True
+        mock_agent.config = mock_config
 
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = True
-            mock_config.multi_agent.verbose = True
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Response"]
-            mock_agent.chat.return_value = "Response"
-            mock_agent.get_token_session_summary.return_value = {
-                "total_tokens": 100,
-                "agents_used": ["designer"],
-                "session_duration": 3.5,
-            }
-            mock_multi_agent_class.return_value = mock_agent
+        mock_agent.get_token_session_summary.return_value = {
+            "total_tokens": 100,
+            "agents_used": ["designer"],
+            "session_duration": 3.5,
+        }
 
-            # Mock user input: question then exit
-            mock_prompt.side_effect = ["Test question", "exit"]
+        # User input: question then exit
+        user_input = "Test question\nexit\n"
 
-            # Run command
-            result = runner.invoke(chat_command, [])
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
 
-            # Verify
-            assert result.exit_code == 0
-            assert "🪙 Tokens: 100 (designer)" in result.output
-            assert "📊 Session completed: 1 exchanges" in result.output
+        # Verify
+        assert result.exit_code == 0
+        assert "🪙 Tokens: 100 (designer)" in result.output
+        assert "📊 Session completed: 1 exchanges" in result.output
 
 
 class TestChatCommandIntegration:
     """Integration tests for chat command."""
 
-    def test_chat_command_full_conversation(self):
+    def test_chat_command_full_conversation(self, runner, mock_agent, mock_config, chat_mocks):
         """Test complete chat conversation workflow."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["First response"]
-            mock_agent.chat_stream.return_value = ["Second response"]
-            mock_agent.chat.return_value = "Second response"
-            mock_agent.get_available_tools.return_value = [
-                {"name": "test_tool", "description": "Test"}
-            ]
-            mock_agent.get_config_summary.return_value = {
-                "llm": {"provider": "openai", "model": "gpt-3.5-turbo"},
-                "embedding": {"type": "openai", "model": "text-embedding-3-small"},
-                "vectorstore": {"type": "chroma", "directory": "/tmp/chroma", "collection": "test"},
-                "multi_agent": {
-                    "mode": "single",
-                    "agents": ["rag_agent"],
-                    "track_tokens": False,
-                    "verbose": False,
-                },
-            }
-            # Set up agent config to avoid Mock comparison errors
-            mock_agent.config = mock_config
-            # Mock the token session summary method to return proper values
-            mock_agent.get_token_session_summary.return_value = {
-                "total_tokens": 0,
-                "agents_used": [],
-                "session_duration": 0.0,
-            }
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock conversation flow
-            mock_prompt.side_effect = [
-                "First question",
-                "tools",
-                "config",
-                "Second question",
-                "exit",
-            ]
-
-            # Run command
-            result = runner.invoke(chat_command, ["--show-config"])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "CONFIGURATION SUMMARY:" in result.output
-            assert "Second response" in result.output
-            assert "🔧 AVAILABLE TOOLS:" in result.output
-            assert "⚙️  CURRENT CONFIGURATION:" in result.output
-            assert "Second response" in result.output
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
-            assert "📊 Session completed: 2 exchanges" in result.output
-
-    def test_chat_command_with_debug_streaming(self):
-        """Test chat command with debug streaming enabled."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.return_value = ["Debug", " response"]
-            mock_agent.chat_stream.return_value = ["Debug", " response"]
-            mock_agent.chat.return_value = "Debug response"
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock user input and exit
-            mock_prompt.side_effect = ["Test question", "exit"]
-
-            # Run command with debug streaming
-            result = runner.invoke(chat_command, ["--debug-streaming"])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "Debug response" in result.output
-
-    def test_chat_command_error_recovery(self):
+        # Setup mocks
+        mock_agent.chat_stream.side_effect = [("First response",), ("Second response",)]
+        mock_agent.chat.return_value = "Second response"
+        mock_agent.get_available_tools.return_value = [{"name": "test_tool", "description": "Test"}]
+        # Set up agent config to avoid Mock comparison errors
+        mock_agent.config = mock_config
+        # Mock the token session summary method to return proper values
+        mock_agent.get_token_session_summary.return_value = {
+            "total_tokens": 0,
+            "agents_used": [],
+            "session_duration": 0.0,
+        }
+
+        # Conversation flow
+        user_input = "First question\ntools\nconfig\nSecond question\nexit\n"
+
+        # Run command
+        result = runner.invoke(chat_command, ["--show-config"], input=user_input)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "CONFIGURATION SUMMARY:" in result.output
+        assert "First response" in result.output
+        assert _MSG_TOOLS in result.output
+        assert _MSG_CURRENT_CONFIG in result.output
+        assert "Second response" in result.output
+        assert mock_agent.chat_stream.call_count == 2
+        assert _MSG_GOODBYE in result.output
+        assert "📊 Session completed: 2 exchanges" in result.output
+
+    @pytest.mark.parametrize(
+        "args,chunks",
+        [
+            ([], ("Streamed", " response")),
+            (["--debug-streaming"], ("Debug", " response")),
+        ],
+        ids=["default", "debug"],
+    )
+    def test_chat_command_streaming_modes(self, runner, mock_agent, chat_mocks, args, chunks):
+        """Test chat command streams the reply with and without debug streaming."""
+        # Setup mocks
+        mock_agent.chat_stream.return_value = chunks
+
+        # User input and exit
+        user_input = "Test question\nexit\n"
+
+        # Run command
+        result = runner.invoke(chat_command, args, input=user_input)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "".join(chunks) in result.output
+        mock_agent.chat.assert_not_called()
+
+    def test_chat_command_error_recovery(self, runner, mock_agent, chat_mocks):
         """Test chat command error recovery and graceful handling."""
-        runner = CliRunner()
-
-        with patch("src.paas_ai.cli.commands.agent.chat.load_config") as mock_load_config, patch(
-            "src.paas_ai.cli.commands.agent.chat.MultiAgentSystem"
-        ) as mock_multi_agent_class, patch(
-            "src.paas_ai.cli.commands.agent.chat.click.prompt"
-        ) as mock_prompt:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.embedding.type = "openai"
-            mock_config.multi_agent.track_tokens = False
-            mock_config.multi_agent.verbose = False
-            mock_load_config.return_value = mock_config
-
-            mock_agent = Mock()
-            mock_agent.chat_stream.side_effect = Exception("Processing error")
-            mock_agent.ask.return_value = "Fallback response"
-            mock_agent.chat_stream.side_effect = Exception("Processing error")
-            mock_agent.chat.return_value = "Fallback response"
-            mock_agent.get_token_session_summary.return_value = {"total_tokens": 0}
-            mock_multi_agent_class.return_value = mock_agent
-
-            # Mock user input: question then exit
-            mock_prompt.side_effect = ["Test question", "exit"]
-
-            # Run command
-            result = runner.invoke(chat_command, [])
-
-            # Verify
-            assert result.exit_code == 0
-            assert "⚠️ Streaming failed, falling back to standard mode" in result.output
-            assert "Fallback response" in result.output
-            assert "💬 Exchanges in session: 1" in result.output
-            assert "👋 Thanks for chatting! Goodbye!" in result.output
+        # Setup mocks
+        mock_agent.chat_stream.side_effect = Exception("Processing error")
+        mock_agent.chat.return_value = "Fallback response"
+
+        # User input: question then exit
+        user_input = "Test question\nexit\n"
+
+        # Run command
+        result = runner.invoke(chat_command, [], input=user_input)
+
+        # Verify
+        assert result.exit_code == 0
+        assert _MSG_FALLBACK in result.output
+        assert "Fallback response" in result.output
+        assert "💬 Exchanges in session: 1" in result.output
+        assert _MSG_GOODBYE in result.output
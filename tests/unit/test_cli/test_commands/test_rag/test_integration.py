@@ -22,7 +22,7 @@ from click.testing import CliRunner
 
 from src.paas_ai.cli.commands.rag import rag
 from src.paas_ai.core.config import ConfigurationError, ResourceType
-from src.paas_ai.core.rag import RAGProcessor
+from src.paas_ai.core.rag import RAGProcessor, SearchHit
 
 
 class TestRAGCLISystemIntegration:
@@ -65,15 +65,15 @@ class TestRAGCLISystemIntegration:
             mock_search_processor_class.return_value = mock_search_processor
             mock_search_processor.get_stats.return_value = {"status": "ready", "total_documents": 5}
             mock_search_processor.search.return_value = [
-                {
-                    "content": "Test content about kubernetes",
-                    "metadata": {
+                SearchHit(
+                    content="Test content about kubernetes",
+                    metadata={
                         "source_url": "https://example.com/doc",
                         "resource_type": "dsl",
                         "tags": ["kubernetes"],
                     },
-                    "score": 0.9,
-                }
+                    score=0.9,
+                )
             ]
 
             # Setup mocks for status
@@ -220,15 +220,15 @@ class TestRAGCLISystemIntegration:
                 "total_documents": 15,
             }
             mock_search_processor.search.return_value = [
-                {
-                    "content": "Microservices architecture patterns",
-                    "metadata": {
+                SearchHit(
+                    content="Microservices architecture patterns",
+                    metadata={
                         "source_url": "https://example.com/microservices",
                         "resource_type": "contextual",
                         "tags": ["microservices", "architecture"],
                     },
-                    "score": 0.95,
-                }
+                    score=0.95,
+                )
             ]
 
             # Setup mocks for reports
@@ -672,15 +672,15 @@ class TestRAGCLIRealWorldScenarios:
                     "total_documents": 15,
                 }
                 mock_search_processor.search.return_value = [
-                    {
-                        "content": "API documentation for REST endpoints",
-                        "metadata": {
+                    SearchHit(
+                        content="API documentation for REST endpoints",
+                        metadata={
                             "source_url": "https://docs.example.com/api",
                             "resource_type": "dsl",
                             "tags": ["api", "documentation"],
                         },
-                        "score": 0.95,
-                    }
+                        score=0.95,
+                    )
                 ]
 
                 mock_sync_logger_instance = Mock()
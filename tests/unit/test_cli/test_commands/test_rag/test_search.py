@@ -20,7 +20,7 @@ from click.testing import CliRunner
 
 from src.paas_ai.cli.commands.rag.search import search
 from src.paas_ai.core.config import ConfigurationError, ResourceType
-from src.paas_ai.core.rag import RAGProcessor
+from src.paas_ai.core.rag import RAGProcessor, SearchHit
 
 
 class TestSearchCommand:
@@ -64,7 +64,7 @@ class TestSearchCommand:
                     "score": 0.87,
                 },
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command
             result = runner.invoke(search, ["kubernetes deployment"])
@@ -114,7 +114,7 @@ class TestSearchCommand:
                     "score": 0.9,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with JSON format
             result = runner.invoke(search, ["--format", "json", "test query"])
@@ -178,7 +178,7 @@ class TestSearchCommand:
                     "score": 0.85,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with resource type filter
             result = runner.invoke(search, ["--type", "guidelines", "security"])
@@ -221,7 +221,7 @@ class TestSearchCommand:
                 }
                 for i in range(10)
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with custom limit
             result = runner.invoke(search, ["--limit", "10", "test query"])
@@ -376,7 +376,7 @@ class TestSearchEdgeCases:
                     "score": 0.9,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with 'all' type (default)
             result = runner.invoke(search, ["--type", "all", "test query"])
@@ -415,7 +415,7 @@ class TestSearchEdgeCases:
                     "score": 0.5,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with empty query
             result = runner.invoke(search, [""])
@@ -454,7 +454,7 @@ class TestSearchEdgeCases:
                     "score": 0.8,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with long query
             result = runner.invoke(search, [long_query])
@@ -493,7 +493,7 @@ class TestSearchEdgeCases:
                     "score": 0.7,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with special characters
             result = runner.invoke(search, [special_query])
@@ -532,7 +532,7 @@ class TestSearchEdgeCases:
                     "score": 0.6,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with unicode query
             result = runner.invoke(search, [unicode_query])
@@ -577,7 +577,7 @@ class TestSearchEdgeCases:
                     "score": 0.9,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command
             result = runner.invoke(search, ["test query"])
@@ -619,7 +619,7 @@ class TestSearchEdgeCases:
                     "score": 0.9,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command
             result = runner.invoke(search, ["test query"])
@@ -655,7 +655,7 @@ class TestSearchEdgeCases:
                     "score": 0.9,
                 }
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with config profile
             result = runner.invoke(search, ["--config-profile", "local", "test query"])
@@ -716,7 +716,7 @@ class TestSearchIntegration:
                     "score": 0.82,
                 },
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command
             result = runner.invoke(
@@ -783,7 +783,7 @@ class TestSearchIntegration:
                     "score": 0.8,
                 },
             ]
-            mock_processor.search.return_value = mock_results
+            mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
             # Run command with JSON format
             result = runner.invoke(search, ["--format", "json", "--limit", "2", "test query"])
@@ -920,7 +920,7 @@ class TestSearchIntegration:
                         "score": 0.9,
                     }
                 ]
-                mock_processor.search.return_value = mock_results
+                mock_processor.search.return_value = [SearchHit(**r) for r in mock_results]
 
                 # Run command with specific resource type
                 result = runner.invoke(search, ["--type", type_str, "test query"])
@@ -339,6 +339,54 @@ class TestEmbeddingsFactoryEdgeCases:
                 EmbeddingsFactory.create_embeddings(config)
 
 
+class TestSharedEmbeddings:
+    """Test EmbeddingsFactory.get_or_create_embeddings."""
+    
+    def _config(self, **params):
+        return EmbeddingConfig(
+            type=EmbeddingType.SENTENCE_TRANSFORMERS,
+            model_name="all-MiniLM-L6-v2",
+            params=params
+        )
+    
+    def test_equivalent_configs_share_instance(self):
+        """Test that identical configs get the same live instance."""
+        with patch('src.paas_ai.core.rag.embeddings.factory.EmbeddingRegistry.get_strategy') as mock_get_strategy:
+            mock_strategy = MockEmbeddingStrategy()
+            mock_get_strategy.return_value = mock_strategy
+            
+            first = EmbeddingsFactory.get_or_create_embeddings(self._config(device="cpu", normalize=True))
+            second = EmbeddingsFactory.get_or_create_embeddings(self._config(normalize=True, device="cpu"))
+            
+            assert first is second
+            assert len(mock_strategy.creation_calls) == 1
+    
+    def test_different_params_get_separate_instances(self):
+        """Test that configs differing in params are not shared."""
+        with patch('src.paas_ai.core.rag.embeddings.factory.EmbeddingRegistry.get_strategy') as mock_get_strategy:
+            mock_strategy = MockEmbeddingStrategy()
+            mock_get_strategy.return_value = mock_strategy
+            
+            first = EmbeddingsFactory.get_or_create_embeddings(self._config(device="cpu"))
+            second = EmbeddingsFactory.get_or_create_embeddings(self._config(device="cuda"))
+            
+            assert first is not second
+            assert len(mock_strategy.creation_calls) == 2
+    
+    def test_released_instance_is_recreated(self):
+        """Test that the registry does not keep unused instances alive."""
+        import gc
+        with patch('src.paas_ai.core.rag.embeddings.factory.EmbeddingRegistry.get_strategy') as mock_get_strategy:
+            mock_strategy = MockEmbeddingStrategy()
+            mock_get_strategy.return_value = mock_strategy
+            
+            EmbeddingsFactory.get_or_create_embeddings(self._config(device="mps"))
+            gc.collect()
+            EmbeddingsFactory.get_or_create_embeddings(self._config(device="mps"))
+            
+            assert len(mock_strategy.creation_calls) == 2
+
+
 class TestEmbeddingsFactoryIntegration:
     """Integration tests for EmbeddingsFactory."""
     
@@ -0,0 +1,257 @@
+"""
+Unit tests for the RAG pipeline processor.
+
+Tests RAGProcessor.search including:
+- Per-call search kwargs on retrievers shared through the factory cache
+- Concurrent searches with different limits and filters
+- Resource type filters pushed down to and merged with configured filters
+- Chunk deduplication across processor instances
+- Knowledge base stats for vectorstore subclasses
+"""
+
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from langchain_chroma import Chroma
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.paas_ai.core.config.schemas import DEFAULT_CONFIG_PROFILES, VectorStoreType
+from src.paas_ai.core.rag.config import (
+    LoaderConfig, LoaderType, ResourceConfig, ResourceType, SplitterConfig, SplitterType
+)
+from src.paas_ai.core.rag.embeddings import EmbeddingsFactory
+from src.paas_ai.core.rag.pipeline import RAGProcessor, VectorStoreStage, _merge_filters
+from src.paas_ai.core.rag.processing import ProcessingContext
+from src.paas_ai.core.rag.retrievers import CachedRetriever, RetrieverFactory
+from src.paas_ai.core.rag.vectorstore import VectorStoreFactory
+from src.paas_ai.core.rag.vectorstore.chroma import clear_clients
+from src.paas_ai.core.rag.vectorstore.faiss import MemoryMappedFAISS
+
+
+TEXTS = [f"kubernetes deployment {i}" for i in range(6)]
+METADATAS = [
+    {"resource_type": "dsl" if i % 2 else "guidelines", "source_url": f"https://docs/{i}"}
+    for i in range(6)
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_factory_cache():
+    """Ensure factory-level caches do not leak between tests."""
+    RetrieverFactory.clear_cache()
+    VectorStoreFactory.clear_cache()
+    yield
+    RetrieverFactory.clear_cache()
+    VectorStoreFactory.clear_cache()
+
+
+def make_processor(tmp_path, retriever_params=None, search_kwargs=None):
+    """Build a processor over an in-memory FAISS store with fake embeddings."""
+    config = DEFAULT_CONFIG_PROFILES["local"].model_copy(deep=True)
+    config.vectorstore.persist_directory = str(tmp_path / "missing")
+    if retriever_params:
+        config.retriever.params = retriever_params
+    if search_kwargs:
+        config.retriever.search_kwargs = search_kwargs
+
+    embeddings = DeterministicFakeEmbedding(size=8)
+    with patch.object(EmbeddingsFactory, 'get_or_create_embeddings', return_value=embeddings):
+        processor = RAGProcessor(config)
+
+    processor.vectorstore = FAISS.from_texts(TEXTS, embeddings, metadatas=METADATAS)
+    processor.retriever = RetrieverFactory.create_retriever(
+        processor.config.retriever, processor.vectorstore
+    )
+    return processor
+
+
+class TestRAGProcessorSearch:
+    """Test RAGProcessor.search."""
+
+    def test_search_does_not_mutate_retriever_search_kwargs(self, tmp_path):
+        """Test that limit and resource type are applied per call, not to the shared retriever."""
+        processor = make_processor(tmp_path)
+
+        results = processor.search("kubernetes", resource_type=ResourceType.DSL, limit=2)
+
+        assert len(results) == 2
+        assert processor.retriever.search_kwargs == {"k": 5}
+
+    def test_processors_sharing_a_retriever_keep_their_own_limits(self, tmp_path):
+        """Test that concurrent searches on one cached retriever do not overwrite each other."""
+        first = make_processor(tmp_path)
+        second = make_processor(tmp_path)
+        second.vectorstore = first.vectorstore
+        second.retriever = RetrieverFactory.create_retriever(second.config.retriever, first.vectorstore)
+        assert second.retriever is first.retriever
+
+        def run(limit):
+            processor = first if limit % 2 else second
+            resource_type = ResourceType.DSL if limit == 3 else None
+            return limit, resource_type, processor.search("kubernetes", resource_type=resource_type, limit=limit)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(run, [1, 2, 3, 4] * 10))
+
+        for limit, resource_type, results in outcomes:
+            assert len(results) == limit
+            if resource_type:
+                assert all(hit.metadata["resource_type"] == "dsl" for hit in results)
+
+    def test_search_through_cached_retriever_shares_result_cache(self, tmp_path):
+        """Test that the per-call copy of a cached retriever fills the shared result cache."""
+        processor = make_processor(tmp_path, retriever_params={"query_cache_size": 16})
+        assert isinstance(processor.retriever, CachedRetriever)
+
+        processor.search("kubernetes", limit=2)
+
+        assert len(processor.retriever._cache) == 1
+        assert processor.retriever.search_kwargs == {"k": 5}
+
+    def test_search_pushes_resource_type_filter_down(self, tmp_path):
+        """Test that the resource type filter and limit reach the vectorstore search."""
+        processor = make_processor(tmp_path)
+
+        with patch.object(
+            processor.vectorstore, 'similarity_search', wraps=processor.vectorstore.similarity_search
+        ) as similarity_search:
+            results = processor.search("kubernetes", resource_type=ResourceType.DSL, limit=2)
+
+        similarity_search.assert_called_once_with("kubernetes", k=2, filter={"resource_type": "dsl"})
+        assert [hit.metadata["resource_type"] for hit in results] == ["dsl", "dsl"]
+
+    def test_search_merges_resource_type_with_configured_filter(self, tmp_path):
+        """Test that the resource type filter narrows, rather than replaces, the configured filter."""
+        processor = make_processor(
+            tmp_path, search_kwargs={"k": 5, "filter": {"source_url": "https://docs/1"}}
+        )
+
+        dsl_results = processor.search("kubernetes", resource_type=ResourceType.DSL)
+        guideline_results = processor.search("kubernetes", resource_type=ResourceType.GUIDELINES)
+
+        assert [hit.metadata["source_url"] for hit in dsl_results] == ["https://docs/1"]
+        assert guideline_results == []
+        assert processor.retriever.search_kwargs == {"k": 5, "filter": {"source_url": "https://docs/1"}}
+
+    def test_search_leaves_retriever_unchanged_after_error(self, tmp_path):
+        """Test that a failing search does not leave its kwargs on the retriever."""
+        processor = make_processor(tmp_path)
+
+        with patch.object(processor.vectorstore, 'similarity_search', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                processor.search("kubernetes", resource_type=ResourceType.DSL, limit=2)
+
+        assert processor.retriever.search_kwargs == {"k": 5}
+        assert len(processor.search("kubernetes")) == 5
+
+
+class TestMergeFilters:
+    """Test combining configured and resource type metadata filters."""
+
+    def test_without_configured_filter(self):
+        """Test that the resource type filter is used as-is when nothing is configured."""
+        assert _merge_filters(Mock(spec=FAISS), None, {"resource_type": "dsl"}) == {"resource_type": "dsl"}
+
+    def test_chroma_filters_are_combined_with_and(self):
+        """Test that Chroma filters are combined with an $and clause."""
+        merged = _merge_filters(Mock(spec=Chroma), {"source_url": "https://docs"}, {"resource_type": "dsl"})
+
+        assert merged == {"$and": [{"source_url": "https://docs"}, {"resource_type": "dsl"}]}
+
+    def test_faiss_filters_are_merged(self):
+        """Test that FAISS filters are merged into one dict."""
+        merged = _merge_filters(Mock(spec=FAISS), {"source_url": "https://docs"}, {"resource_type": "dsl"})
+
+        assert merged == {"source_url": "https://docs", "resource_type": "dsl"}
+
+
+class TestRAGProcessorStats:
+    """Test RAGProcessor.get_stats."""
+
+    def test_stats_count_memory_mapped_faiss(self, tmp_path):
+        """Test that documents are counted for a FAISS store loaded with mmap."""
+        embeddings = DeterministicFakeEmbedding(size=8)
+        FAISS.from_texts(TEXTS, embeddings, metadatas=METADATAS).save_local(str(tmp_path / "faiss"))
+        config = DEFAULT_CONFIG_PROFILES["local"].model_copy(deep=True)
+        config.vectorstore.type = VectorStoreType.FAISS
+        config.vectorstore.persist_directory = str(tmp_path / "faiss")
+        config.vectorstore.params = {"mmap": True, "allow_dangerous_deserialization": True}
+
+        with patch.object(EmbeddingsFactory, 'get_or_create_embeddings', return_value=embeddings):
+            processor = RAGProcessor(config)
+
+        assert isinstance(processor.vectorstore, MemoryMappedFAISS)
+        assert processor.get_stats()["total_documents"] == len(TEXTS)
+
+
+class TestVectorStoreStage:
+    """Test VectorStoreStage deduplication."""
+
+    resource = ResourceConfig(
+        url="https://docs",
+        resource_type=ResourceType.DSL,
+        loader=LoaderConfig(type=LoaderType.WEB),
+        splitter=SplitterConfig(type=SplitterType.RECURSIVE_CHARACTER),
+    )
+
+    def _store(self, config, embeddings, documents):
+        """Run documents through the vectorstore stage of a fresh processor."""
+        with patch.object(EmbeddingsFactory, 'get_or_create_embeddings', return_value=embeddings):
+            processor = RAGProcessor(config)
+        context = asyncio.run(VectorStoreStage(processor).process(
+            ProcessingContext(resource=self.resource, documents=documents)
+        ))
+        return processor, context
+
+    def _documents(self):
+        return [Document(page_content=text, metadata={"source_url": self.resource.url}) for text in TEXTS]
+
+    def test_dedupes_chunks_across_processor_instances(self, tmp_path):
+        """Test that a new processor skips chunks an earlier one already stored."""
+        config = DEFAULT_CONFIG_PROFILES["local"].model_copy(deep=True)
+        config.vectorstore.persist_directory = str(tmp_path / "chroma")
+        embeddings = DeterministicFakeEmbedding(size=8)
+        documents = self._documents()
+
+        try:
+            first, _ = self._store(config, embeddings, documents)
+            VectorStoreFactory.clear_cache()
+            second, context = self._store(config, embeddings, documents + [Document(page_content="helm chart")])
+
+            assert second.vectorstore is not first.vectorstore
+            assert [doc.page_content for doc in context.documents] == ["helm chart"]
+            assert second.vectorstore._collection.count() == len(TEXTS) + 1
+        finally:
+            clear_clients()
+
+    @pytest.mark.parametrize("params", [
+        {"faiss_index_type": "HNSW"},
+        {"ingest_concurrency": 2, "embedding_batch_size": 2},
+    ], ids=["hnsw", "concurrent"])
+    def test_dedupes_chunks_across_sessions_on_prebuilt_faiss(self, tmp_path, params):
+        """Test that re-adding chunks to a reloaded HNSW or concurrently built FAISS store embeds nothing."""
+        config = DEFAULT_CONFIG_PROFILES["local"].model_copy(deep=True)
+        config.vectorstore.type = VectorStoreType.FAISS
+        config.vectorstore.persist_directory = str(tmp_path / "faiss")
+        config.vectorstore.params = params
+        embeddings = DeterministicFakeEmbedding(size=8)
+        documents = self._documents()
+        self._store(config, embeddings, documents)
+
+        VectorStoreFactory.clear_cache()
+        # Reloading a pickled docstore has to be opted into
+        config.vectorstore.params = {**params, "allow_dangerous_deserialization": True}
+        embed_documents = DeterministicFakeEmbedding.embed_documents
+        with patch.object(
+            DeterministicFakeEmbedding, 'embed_documents', autospec=True, side_effect=embed_documents
+        ) as mock_embed:
+            second, context = self._store(config, embeddings, documents)
+
+        assert second.vectorstore is not None
+        assert context.documents == []
+        mock_embed.assert_not_called()
+        assert second.vectorstore.index.ntotal == len(TEXTS)
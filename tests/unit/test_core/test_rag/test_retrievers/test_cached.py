@@ -0,0 +1,161 @@
+"""
+Unit tests for the cached retriever wrapper.
+
+Tests all components of the CachedRetriever including:
+- Cache hits and misses
+- Search kwargs in the cache key
+- LRU eviction
+- Cache invalidation
+- Factory integration via params['query_cache_size']
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from typing import List
+
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from src.paas_ai.core.rag.retrievers.cached import CachedRetriever
+from src.paas_ai.core.rag.retrievers.factory import RetrieverFactory
+from src.paas_ai.core.rag.retrievers.registry import RetrieverRegistry
+from src.paas_ai.core.rag.config import RetrieverConfig, RetrieverType
+
+
+class CountingRetriever(BaseRetriever):
+    """Retriever that records every query it serves."""
+
+    search_kwargs: dict = {"k": 4}
+    calls: List[str] = []
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        self.calls.append(query)
+        return [Document(page_content=f"{query} {self.search_kwargs.get('k')}")]
+
+
+@pytest.fixture(autouse=True)
+def clear_factory_cache():
+    """Ensure factory-level caches do not leak between tests."""
+    RetrieverFactory.clear_cache()
+    yield
+    RetrieverFactory.clear_cache()
+
+
+class TestCachedRetriever:
+    """Test the CachedRetriever class."""
+
+    def test_repeated_query_hits_cache(self):
+        """Test that a repeated query is served without calling the wrapped retriever."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner)
+
+        first = retriever.invoke("kubernetes")
+        second = retriever.invoke("kubernetes")
+
+        assert first == second
+        assert inner.calls == ["kubernetes"]
+
+    def test_search_kwargs_are_part_of_key(self):
+        """Test that changing search kwargs misses the cache."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner)
+
+        retriever.invoke("kubernetes")
+        retriever.search_kwargs["k"] = 8
+        result = retriever.invoke("kubernetes")
+
+        assert inner.calls == ["kubernetes", "kubernetes"]
+        assert result[0].page_content == "kubernetes 8"
+
+    def test_search_kwargs_delegates_to_wrapped_retriever(self):
+        """Test that search_kwargs exposes the wrapped retriever's dict."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner)
+
+        assert retriever.search_kwargs is inner.search_kwargs
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test that the cache is bounded by cache_size."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner, cache_size=2)
+
+        retriever.invoke("a")
+        retriever.invoke("b")
+        retriever.invoke("a")
+        retriever.invoke("c")  # evicts "b"
+        retriever.invoke("a")
+        retriever.invoke("b")
+
+        assert inner.calls == ["a", "b", "c", "b"]
+
+    def test_clear_drops_cached_results(self):
+        """Test that clear forces the next query to hit the wrapped retriever."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner)
+
+        retriever.invoke("kubernetes")
+        retriever.clear()
+        retriever.invoke("kubernetes")
+
+        assert inner.calls == ["kubernetes", "kubernetes"]
+
+    def test_returned_list_is_a_copy(self):
+        """Test that callers mutating results do not corrupt the cache."""
+        inner = CountingRetriever(calls=[])
+        retriever = CachedRetriever(retriever=inner)
+
+        retriever.invoke("kubernetes").clear()
+
+        assert len(retriever.invoke("kubernetes")) == 1
+
+
+class TestCachedRetrieverFactoryIntegration:
+    """Test wrapping retrievers through RetrieverFactory."""
+
+    def test_query_cache_size_wraps_retriever(self):
+        """Test that params['query_cache_size'] wraps the strategy's retriever."""
+        config = RetrieverConfig(
+            type=RetrieverType.SIMILARITY,
+            params={"query_cache_size": 16}
+        )
+        inner = CountingRetriever(calls=[])
+        strategy = Mock()
+        strategy.create_retriever.return_value = inner
+
+        with patch.object(RetrieverRegistry, 'get_strategy', return_value=strategy):
+            result = RetrieverFactory.create_retriever(config, Mock())
+
+        assert isinstance(result, CachedRetriever)
+        assert result.cache_size == 16
+        assert result.retriever is inner
+
+    def test_query_cache_size_not_passed_to_strategy(self):
+        """Test that the strategy never sees query_cache_size."""
+        config = RetrieverConfig(
+            type=RetrieverType.SIMILARITY,
+            params={"query_cache_size": 16, "tags": ["docs"]}
+        )
+        strategy = Mock()
+        strategy.create_retriever.return_value = CountingRetriever(calls=[])
+
+        with patch.object(RetrieverRegistry, 'get_strategy', return_value=strategy):
+            RetrieverFactory.create_retriever(config, Mock())
+
+        strategy_config = strategy.create_retriever.call_args.args[0]
+        assert strategy_config.params == {"tags": ["docs"]}
+        assert config.params == {"query_cache_size": 16, "tags": ["docs"]}
+
+    def test_zero_query_cache_size_disables_cache(self):
+        """Test that a cache size of 0 leaves the retriever unwrapped."""
+        config = RetrieverConfig(
+            type=RetrieverType.SIMILARITY,
+            params={"query_cache_size": 0}
+        )
+        inner = CountingRetriever(calls=[])
+        strategy = Mock()
+        strategy.create_retriever.return_value = inner
+
+        with patch.object(RetrieverRegistry, 'get_strategy', return_value=strategy):
+            result = RetrieverFactory.create_retriever(config, Mock())
+
+        assert result is inner
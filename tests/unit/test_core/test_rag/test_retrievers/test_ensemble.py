@@ -12,7 +12,13 @@ Tests all components of the EnsembleRetrieverStrategy including:
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from src.paas_ai.core.rag.retrievers.ensemble import EnsembleRetrieverStrategy
+from langchain_core.documents import Document
+
+from src.paas_ai.core.rag.retrievers.ensemble import (
+    EnsembleRetrieverStrategy,
+    LazyEnsembleRetriever,
+    _maximal_marginal_relevance,
+)
 from src.paas_ai.core.rag.config import RetrieverConfig, RetrieverType
 
 
@@ -740,3 +746,162 @@ class TestEnsembleRetrieverStrategyIntegration:
             mmr_call = vectorstore.calls[1]
             assert mmr_call["search_type"] == "mmr"
             assert mmr_call["search_kwargs"] == {"k": 5}
+
+
+class TestLazyEnsembleRetriever:
+    """Test the single-search ensemble retriever."""
+    
+    def _faiss_store(self):
+        from langchain_community.embeddings import DeterministicFakeEmbedding
+        from langchain_community.vectorstores import FAISS
+        
+        return FAISS.from_texts(
+            [f"doc {i}" for i in range(20)],
+            DeterministicFakeEmbedding(size=8),
+            metadatas=[{"resource_type": "dsl" if i % 2 else "guidelines"} for i in range(20)]
+        )
+    
+    def test_strategy_creates_lazy_retriever(self):
+        """Test that params['lazy'] builds a LazyEnsembleRetriever."""
+        strategy = EnsembleRetrieverStrategy()
+        config = RetrieverConfig(
+            type=RetrieverType.ENSEMBLE,
+            search_kwargs={"k": 3},
+            params={"weights": [0.7, 0.3], "lazy": True, "fetch_multiplier": 3}
+        )
+        vectorstore = self._faiss_store()
+        
+        result = strategy.create_retriever(config, vectorstore)
+        
+        assert isinstance(result, LazyEnsembleRetriever)
+        assert result.weights == [0.7, 0.3]
+        assert result.fetch_multiplier == 3
+        assert result.search_kwargs == {"k": 3}
+        assert config.params["lazy"] is True
+    
+    def test_single_vectorstore_search(self):
+        """Test that one query embedding and one vectorstore search serve both rankings."""
+        vectorstore = self._faiss_store()
+        retriever = LazyEnsembleRetriever(vectorstore=vectorstore, search_kwargs={"k": 4})
+        
+        with patch.object(
+            type(vectorstore), 'similarity_search_with_score_by_vector',
+            autospec=True, side_effect=type(vectorstore).similarity_search_with_score_by_vector
+        ) as mock_search:
+            results = retriever.invoke("query")
+        
+        mock_search.assert_called_once()
+        assert mock_search.call_args.kwargs["k"] == 8
+        assert 4 <= len(results) <= 8
+        assert len({doc.page_content for doc in results}) == len(results)
+    
+    def test_top_similarity_match_included(self):
+        """Test that the best similarity match is part of the fused results."""
+        vectorstore = self._faiss_store()
+        retriever = LazyEnsembleRetriever(vectorstore=vectorstore, search_kwargs={"k": 4})
+        
+        best = vectorstore.similarity_search("query", k=1)[0]
+        results = retriever.invoke("query")
+        
+        assert best.page_content in [doc.page_content for doc in results]
+    
+    def test_filter_pushed_down(self):
+        """Test that search_kwargs['filter'] restricts the candidates."""
+        retriever = LazyEnsembleRetriever(
+            vectorstore=self._faiss_store(),
+            search_kwargs={"k": 4, "filter": {"resource_type": "dsl"}}
+        )
+        
+        results = retriever.invoke("query")
+        
+        assert results
+        assert all(doc.metadata["resource_type"] == "dsl" for doc in results)
+    
+    def test_fuse_uses_weighted_reciprocal_rank(self):
+        """Test fusion order and deduplication."""
+        retriever = LazyEnsembleRetriever(vectorstore=self._faiss_store(), weights=[0.2, 0.8], c=0)
+        a, b, c = (Document(page_content=text) for text in "abc")
+        
+        fused = retriever._fuse([[a, b], [c, a]])
+        
+        # a: 0.2/1 + 0.8/2 = 0.6, c: 0.8/1 = 0.8, b: 0.2/2 = 0.1
+        assert [doc.page_content for doc in fused] == ["c", "a", "b"]
+    
+    def test_generic_vectorstore_embeds_candidates(self):
+        """Test that stores without vector access fall back to embedding candidates."""
+        vectorstore = Mock()
+        vectorstore.embeddings.embed_query.return_value = [1.0, 0.0]
+        vectorstore.embeddings.embed_documents.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        vectorstore.similarity_search_by_vector.return_value = [
+            Document(page_content="first"), Document(page_content="second")
+        ]
+        retriever = LazyEnsembleRetriever.model_construct(
+            vectorstore=vectorstore, search_kwargs={"k": 1}, weights=[0.5, 0.5], fetch_multiplier=2, c=60
+        )
+        
+        results = retriever._get_relevant_documents("query", run_manager=Mock())
+        
+        vectorstore.similarity_search_by_vector.assert_called_once_with([1.0, 0.0], k=2)
+        assert [doc.page_content for doc in results] == ["first"]
+    
+    def test_validate_config_invalid_lazy(self):
+        """Test that params['lazy'] must be a boolean."""
+        strategy = EnsembleRetrieverStrategy()
+        config = RetrieverConfig(type=RetrieverType.ENSEMBLE, params={"lazy": "yes"})
+        
+        with pytest.raises(ValueError, match="params\\['lazy'\\] must be a boolean"):
+            strategy.validate_config(config)
+    
+    def test_validate_config_invalid_fetch_multiplier(self):
+        """Test that params['fetch_multiplier'] must be a positive integer."""
+        strategy = EnsembleRetrieverStrategy()
+        config = RetrieverConfig(type=RetrieverType.ENSEMBLE, params={"lazy": True, "fetch_multiplier": 0})
+        
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            strategy.validate_config(config)
+
+
+class TestMaximalMarginalRelevance:
+    """Test the vectorized MMR selection."""
+    
+    def test_matches_langchain_selection(self):
+        """Test that picks match langchain's reference implementation."""
+        import numpy as np
+        from langchain_community.vectorstores.utils import maximal_marginal_relevance
+        
+        rng = np.random.default_rng(42)
+        for _ in range(50):
+            vectors = rng.normal(size=(16, 8)).astype(np.float32)
+            query = rng.normal(size=8).astype(np.float32)
+            lambda_mult = float(rng.random())
+            
+            assert _maximal_marginal_relevance(query, vectors, lambda_mult, 5) == \
+                maximal_marginal_relevance(query, vectors, lambda_mult, 5)
+    
+    def test_k_larger_than_candidates(self):
+        """Test that every candidate is returned once when k exceeds the pool."""
+        import numpy as np
+        
+        vectors = np.eye(3, dtype=np.float32)
+        
+        picks = _maximal_marginal_relevance(np.array([1.0, 0.5, 0.0]), vectors, k=10)
+        
+        assert sorted(picks) == [0, 1, 2]
+        assert picks[0] == 0
+    
+    def test_empty_candidates(self):
+        """Test that no candidates yields no picks."""
+        import numpy as np
+        
+        assert _maximal_marginal_relevance(np.ones(4), np.empty((0, 4)), k=3) == []
+    
+    def test_zero_vectors_do_not_produce_nan(self):
+        """Test that zero-norm vectors are handled without NaN scores."""
+        import numpy as np
+        
+        vectors = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        
+        picks = _maximal_marginal_relevance(np.array([1.0, 0.0]), vectors, k=3)
+        
+        assert picks[0] == 1
+        assert sorted(picks) == [0, 1, 2]
@@ -23,11 +23,13 @@ def clean_registry():
     """Ensure registry is clean before and after each test."""
     # Store original strategies
     original_strategies = RetrieverRegistry._strategies.copy()
+    RetrieverFactory.clear_cache()
     
     yield
     
     # Restore original strategies
     RetrieverRegistry._strategies = original_strategies
+    RetrieverFactory.clear_cache()
 
 
 class MockRetrieverStrategy(RetrieverStrategy):
@@ -399,6 +401,58 @@ class TestRetrieverFactoryEdgeCases:
                 RetrieverFactory.create_retriever(config, vectorstore)
 
 
+class TestRetrieverFactoryCache:
+    """Test the retriever cache."""
+    
+    def test_same_vectorstore_and_config_reuses_retriever(self):
+        """Test that an identical request returns the cached retriever."""
+        config = RetrieverConfig(type=RetrieverType.SIMILARITY, search_kwargs={"k": 4})
+        vectorstore = Mock()
+        
+        with patch.object(RetrieverRegistry, '_strategies', {RetrieverType.SIMILARITY: MockRetrieverStrategy}):
+            first = RetrieverFactory.create_retriever(config, vectorstore)
+            second = RetrieverFactory.create_retriever(config, vectorstore)
+        
+        assert first is second
+    
+    def test_different_search_kwargs_build_new_retriever(self):
+        """Test that changed search kwargs miss the cache."""
+        vectorstore = Mock()
+        
+        with patch.object(RetrieverRegistry, '_strategies', {RetrieverType.SIMILARITY: MockRetrieverStrategy}):
+            first = RetrieverFactory.create_retriever(
+                RetrieverConfig(type=RetrieverType.SIMILARITY, search_kwargs={"k": 4}), vectorstore
+            )
+            second = RetrieverFactory.create_retriever(
+                RetrieverConfig(type=RetrieverType.SIMILARITY, search_kwargs={"k": 8}), vectorstore
+            )
+        
+        assert first is not second
+    
+    def test_different_vectorstore_builds_new_retriever(self):
+        """Test that retrievers are not shared across vectorstores."""
+        config = RetrieverConfig(type=RetrieverType.SIMILARITY)
+        
+        with patch.object(RetrieverRegistry, '_strategies', {RetrieverType.SIMILARITY: MockRetrieverStrategy}):
+            first = RetrieverFactory.create_retriever(config, Mock())
+            second = RetrieverFactory.create_retriever(config, Mock())
+        
+        assert first is not second
+    
+    def test_validation_still_runs_on_cache_hit(self):
+        """Test that configuration is validated even when the retriever is cached."""
+        config = RetrieverConfig(type=RetrieverType.SIMILARITY)
+        vectorstore = Mock()
+        strategy = MockRetrieverStrategy()
+        
+        with patch.object(RetrieverRegistry, 'get_strategy', return_value=strategy):
+            RetrieverFactory.create_retriever(config, vectorstore)
+            RetrieverFactory.create_retriever(config, vectorstore)
+        
+        assert len(strategy.validation_calls) == 2
+        assert len(strategy.creation_calls) == 1
+
+
 class TestRetrieverFactoryIntegration:
     """Integration tests for RetrieverFactory."""
     
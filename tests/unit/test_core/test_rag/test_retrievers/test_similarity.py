@@ -300,6 +300,23 @@ class TestSimilarityRetrieverStrategyEdgeCases:
             assert config.search_kwargs == original_search_kwargs
             assert config.search_kwargs is not original_search_kwargs  # Should be a copy
     
+    def test_retriever_search_kwargs_detached_from_config(self):
+        """Test that tuning the created retriever does not write back into the config."""
+        from langchain_community.embeddings import FakeEmbeddings
+        from langchain_community.vectorstores import FAISS
+        strategy = SimilarityRetrieverStrategy()
+        config = RetrieverConfig(
+            type=RetrieverType.SIMILARITY,
+            search_kwargs={"k": 5},
+            params={}
+        )
+        vectorstore = FAISS.from_texts(["doc"], FakeEmbeddings(size=4))
+        
+        retriever = strategy.create_retriever(config, vectorstore)
+        retriever.search_kwargs["k"] = 1
+        
+        assert config.search_kwargs == {"k": 5}
+    
     def test_validate_config_with_very_large_k(self):
         """Test configuration validation with very large k value."""
         strategy = SimilarityRetrieverStrategy()
@@ -13,7 +13,7 @@ from abc import ABC
 from unittest.mock import Mock, patch
 from pathlib import Path
 
-from src.paas_ai.core.rag.vectorstore.base import VectorStoreStrategy
+from src.paas_ai.core.rag.vectorstore.base import VectorStoreStrategy, embed_in_batches
 from src.paas_ai.core.config.schemas import VectorStoreConfig, VectorStoreType
 
 
@@ -382,3 +382,45 @@ class TestVectorStoreStrategyEdgeCases:
             strategy.validate_config(invalid_config)
         
         assert len(strategy.validation_calls) == 2
+
+
+class TestEmbedInBatches:
+    """Test the embed_in_batches helper."""
+    
+    def test_sequential_batches(self):
+        """Test that texts are embedded in batch_size chunks."""
+        embeddings = Mock()
+        embeddings.embed_documents.side_effect = lambda texts: [[len(text)] for text in texts]
+        
+        batches = list(embed_in_batches(embeddings, ["a", "bb", "ccc"], batch_size=2))
+        
+        assert batches == [[[1], [2]], [[3]]]
+        assert embeddings.embed_documents.call_count == 2
+    
+    def test_concurrent_batches_keep_order(self):
+        """Test that concurrent embedding still yields batches in text order."""
+        import threading
+        import time
+        embeddings = Mock()
+        threads = set()
+        
+        def embed(texts):
+            threads.add(threading.get_ident())
+            # Later batches finish first
+            time.sleep(0.01 * (10 - int(texts[0])))
+            return [[int(text)] for text in texts]
+        
+        embeddings.embed_documents.side_effect = embed
+        texts = [str(i) for i in range(10)]
+        
+        vectors = [v for batch in embed_in_batches(embeddings, texts, batch_size=1, concurrency=4) for v in batch]
+        
+        assert vectors == [[i] for i in range(10)]
+        assert threading.get_ident() not in threads
+    
+    def test_empty_texts(self):
+        """Test that no texts yields no batches."""
+        embeddings = Mock()
+        
+        assert list(embed_in_batches(embeddings, [], concurrency=4)) == []
+        embeddings.embed_documents.assert_not_called()
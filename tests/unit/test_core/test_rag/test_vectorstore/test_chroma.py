@@ -15,11 +15,24 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
 
-from paas_ai.core.rag.vectorstore.chroma import ChromaVectorStoreStrategy
+from paas_ai.core.rag.vectorstore.chroma import ChromaVectorStoreStrategy, _get_client, clear_clients
 from paas_ai.core.config.schemas import VectorStoreConfig, VectorStoreType
 
 
+def fake_client(persist_directory):
+    """Stand-in for the shared Chroma client of a persist directory."""
+    return ("chroma-client", persist_directory)
+
+
+@pytest.fixture(autouse=True)
+def shared_chroma_clients():
+    """Keep tests from opening real persistent Chroma clients."""
+    with patch('paas_ai.core.rag.vectorstore.chroma._get_client', side_effect=fake_client) as mock_get_client:
+        yield mock_get_client
+
+
 class TestChromaVectorStoreStrategy:
     """Test the ChromaVectorStoreStrategy class."""
     
@@ -64,7 +77,7 @@ class TestChromaVectorStoreStrategy:
                     documents=documents,
                     embedding=embeddings,
                     collection_name="test_collection",
-                    persist_directory="/tmp/chroma_test",
+                    client=fake_client("/tmp/chroma_test"),
                     distance_metric="cosine"
                 )
                 
@@ -100,7 +113,7 @@ class TestChromaVectorStoreStrategy:
                 mock_chroma_class.assert_called_once_with(
                     embedding_function=embeddings,
                     collection_name="test_collection",
-                    persist_directory="/tmp/chroma_test",
+                    client=fake_client("/tmp/chroma_test"),
                     distance_metric="cosine"
                 )
                 
@@ -190,7 +203,7 @@ class TestChromaVectorStoreStrategy:
                 mock_chroma_class.assert_called_once_with(
                     embedding_function=embeddings,
                     collection_name="test_collection",
-                    persist_directory=str(mock_path_instance),
+                    client=fake_client(str(mock_path_instance)),
                     distance_metric="cosine"
                 )
                 
@@ -358,6 +371,147 @@ class TestChromaVectorStoreStrategy:
         with pytest.raises(ValueError, match="collection_name must contain only alphanumeric characters, hyphens, and underscores"):
             strategy.validate_config(config)
 
+    
+    def test_create_vectorstore_with_ingest_concurrency(self):
+        """Test that ingest_concurrency adds document batches from a thread pool."""
+        strategy = ChromaVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            params={"ingest_concurrency": 4, "embedding_batch_size": 2, "distance_metric": "cosine"}
+        )
+        embeddings = Mock()
+        documents = [Document(page_content=f"doc {i}") for i in range(5)]
+        
+        with patch('paas_ai.core.rag.vectorstore.chroma.Chroma') as mock_chroma_class:
+            mock_vectorstore = Mock()
+            mock_chroma_class.return_value = mock_vectorstore
+            
+            result = strategy.create_vectorstore(config, embeddings, documents)
+            
+            assert result == mock_vectorstore
+            mock_chroma_class.from_documents.assert_not_called()
+            mock_chroma_class.assert_called_once_with(
+                embedding_function=embeddings,
+                collection_name="test_collection",
+                persist_directory=None,
+                distance_metric="cosine"
+            )
+            batches = sorted((call.args[0] for call in mock_vectorstore.add_documents.call_args_list), key=lambda batch: batch[0].page_content)
+            assert batches == [documents[0:2], documents[2:4], documents[4:5]]
+    
+    def test_load_vectorstore_after_concurrent_ingest(self, tmp_path, shared_chroma_clients):
+        """Test that a store created with ingest params can be loaded back with the same config."""
+        shared_chroma_clients.side_effect = _get_client
+        strategy = ChromaVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            persist_directory=str(tmp_path / "chroma"),
+            params={"ingest_concurrency": 2, "embedding_batch_size": 1}
+        )
+        embeddings = DeterministicFakeEmbedding(size=8)
+        documents = [Document(page_content="doc 0"), Document(page_content="doc 1")]
+        
+        try:
+            strategy.create_vectorstore(config, embeddings, documents)
+            loaded = strategy.load_vectorstore(config, embeddings)
+            
+            assert loaded is not None
+            assert len(loaded.get()["ids"]) == 2
+        finally:
+            clear_clients()
+    
+    def test_validate_config_invalid_ingest_concurrency(self):
+        """Test configuration validation with a non-positive ingest_concurrency."""
+        strategy = ChromaVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            params={"ingest_concurrency": 0}
+        )
+        
+        with pytest.raises(ValueError, match="ingest_concurrency must be a positive integer"):
+            strategy.validate_config(config)
+
+    
+    def test_create_vectorstore_with_hnsw_params(self):
+        """Test that params['hnsw'] is stored as hnsw:* collection metadata."""
+        strategy = ChromaVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            params={
+                "hnsw": {"M": 32, "construction_ef": 200, "search_ef": 64},
+                "collection_metadata": {"owner": "docs"}
+            }
+        )
+        embeddings = Mock()
+        
+        with patch('paas_ai.core.rag.vectorstore.chroma.Chroma') as mock_chroma_class:
+            strategy.create_vectorstore(config, embeddings)
+            
+            mock_chroma_class.assert_called_once_with(
+                embedding_function=embeddings,
+                collection_name="test_collection",
+                persist_directory=None,
+                collection_metadata={
+                    "owner": "docs",
+                    "hnsw:M": 32,
+                    "hnsw:construction_ef": 200,
+                    "hnsw:search_ef": 64
+                }
+            )
+        assert config.params["hnsw"] == {"M": 32, "construction_ef": 200, "search_ef": 64}
+    
+    def test_validate_config_unknown_hnsw_setting(self):
+        """Test configuration validation with an unsupported hnsw setting."""
+        strategy = ChromaVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            params={"hnsw": {"M": 16, "ef": 10}}
+        )
+        
+        with pytest.raises(ValueError, match="Unsupported hnsw settings: ef"):
+            strategy.validate_config(config)
+
+
+class TestSharedChromaClients:
+    """Test the per-directory PersistentClient registry."""
+    
+    def test_client_reused_per_directory(self):
+        """Test that a directory's client is opened once and then shared."""
+        clear_clients()
+        try:
+            with patch('paas_ai.core.rag.vectorstore.chroma.chromadb.PersistentClient') as mock_client_class:
+                mock_client_class.side_effect = lambda path, settings: Mock(path=path)
+                
+                first = _get_client("/tmp/chroma_a")
+                second = _get_client("/tmp/chroma_a")
+                other = _get_client("/tmp/chroma_b")
+            
+            assert first is second
+            assert other is not first
+            assert mock_client_class.call_count == 2
+            assert mock_client_class.call_args.kwargs["settings"].anonymized_telemetry is False
+        finally:
+            clear_clients()
+    
+    def test_clear_clients_reopens(self):
+        """Test that clear_clients forces a fresh client on next use."""
+        clear_clients()
+        try:
+            with patch('paas_ai.core.rag.vectorstore.chroma.chromadb.PersistentClient') as mock_client_class:
+                mock_client_class.side_effect = lambda path, settings: Mock(path=path)
+                
+                first = _get_client("/tmp/chroma_a")
+                clear_clients()
+                second = _get_client("/tmp/chroma_a")
+            
+            assert first is not second
+        finally:
+            clear_clients()
 
 class TestChromaVectorStoreStrategyEdgeCases:
     """Test edge cases for ChromaVectorStoreStrategy."""
@@ -419,7 +573,7 @@ class TestChromaVectorStoreStrategyEdgeCases:
                 mock_chroma_class.assert_called_once_with(
                     embedding_function=embeddings,
                     collection_name="test_collection",
-                    persist_directory="/tmp/chroma_test",
+                    client=fake_client("/tmp/chroma_test"),
                     distance_metric="cosine",
                     collection_metadata={"description": "test collection"},
                     client_settings={"host": "localhost", "port": 8000}
@@ -25,11 +25,13 @@ def reset_factory_registry():
     """Fixture to reset the factory registry after each test to ensure isolation."""
     # Store original strategies
     original_strategies = VectorStoreFactory._strategies.copy()
+    VectorStoreFactory.clear_cache()
     
     yield
     
     # Restore original strategies after test
     VectorStoreFactory._strategies = original_strategies
+    VectorStoreFactory.clear_cache()
 
 
 class MockVectorStoreStrategy(VectorStoreStrategy):
@@ -83,6 +85,27 @@ class TestVectorStoreFactory:
             # Verify result is the mock vector store
             assert result is not None
     
+    def test_create_vectorstore_validates_with_creating_strategy(self):
+        """Test that one strategy instance both validates and creates the store."""
+        config = VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            params={}
+        )
+        instances = []
+        
+        class TrackingStrategy(MockVectorStoreStrategy):
+            def __init__(self):
+                super().__init__()
+                instances.append(self)
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: TrackingStrategy}):
+            VectorStoreFactory.create_vectorstore(config, Mock())
+        
+        assert len(instances) == 1
+        assert instances[0].validation_calls == [config]
+        assert len(instances[0].creation_calls) == 1
+    
     def test_create_vectorstore_validation_error(self):
         """Test vector store creation with validation error."""
         config = VectorStoreConfig(
@@ -327,6 +350,89 @@ class TestVectorStoreFactory:
         assert isinstance(types, list)
 
 
+class TestVectorStoreFactoryCache:
+    """Test the persisted vector store cache."""
+    
+    def _config(self, persist_directory):
+        return VectorStoreConfig(
+            type=VectorStoreType.CHROMA,
+            collection_name="test_collection",
+            persist_directory=str(persist_directory),
+            params={}
+        )
+    
+    def test_load_vectorstore_reuses_unchanged_store(self, tmp_path):
+        """Test that loading an unchanged persist directory returns the cached store."""
+        config = self._config(tmp_path)
+        embeddings = Mock()
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            first = VectorStoreFactory.load_vectorstore(config, embeddings)
+            second = VectorStoreFactory.load_vectorstore(config, embeddings)
+        
+        assert first is second
+    
+    def test_load_vectorstore_reloads_after_change_on_disk(self, tmp_path):
+        """Test that a newer file in the persist directory invalidates the cache."""
+        import os
+        config = self._config(tmp_path)
+        embeddings = Mock()
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            first = VectorStoreFactory.load_vectorstore(config, embeddings)
+            index_file = tmp_path / "index.faiss"
+            index_file.write_text("updated")
+            future = os.stat(tmp_path).st_mtime_ns + 10**9
+            os.utime(index_file, ns=(future, future))
+            second = VectorStoreFactory.load_vectorstore(config, embeddings)
+        
+        assert first is not second
+    
+    def test_load_vectorstore_not_shared_across_params(self, tmp_path):
+        """Test that a store loaded with different params is not served from the cache."""
+        config = self._config(tmp_path)
+        mmap_config = config.model_copy(update={'params': {'mmap': True}})
+        embeddings = Mock()
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            first = VectorStoreFactory.load_vectorstore(config, embeddings)
+            second = VectorStoreFactory.load_vectorstore(mmap_config, embeddings)
+        
+        assert first is not second
+    
+    def test_load_vectorstore_not_shared_across_embeddings(self, tmp_path):
+        """Test that a cached store is only reused for the same embeddings instance."""
+        config = self._config(tmp_path)
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            first = VectorStoreFactory.load_vectorstore(config, Mock())
+            second = VectorStoreFactory.load_vectorstore(config, Mock())
+        
+        assert first is not second
+    
+    def test_load_vectorstore_returns_created_store(self, tmp_path):
+        """Test that loading right after creation returns the created store."""
+        config = self._config(tmp_path)
+        embeddings = Mock()
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            created = VectorStoreFactory.create_vectorstore(config, embeddings)
+            loaded = VectorStoreFactory.load_vectorstore(config, embeddings)
+        
+        assert created is loaded
+    
+    def test_load_vectorstore_missing_directory_not_cached(self, tmp_path):
+        """Test that stores without a persist directory on disk are always reloaded."""
+        config = self._config(tmp_path / "missing")
+        embeddings = Mock()
+        
+        with patch.object(VectorStoreFactory, '_strategies', {VectorStoreType.CHROMA: MockVectorStoreStrategy}):
+            first = VectorStoreFactory.load_vectorstore(config, embeddings)
+            second = VectorStoreFactory.load_vectorstore(config, embeddings)
+        
+        assert first is not second
+
+
 class TestVectorStoreFactoryEdgeCases:
     """Test edge cases for VectorStoreFactory."""
     
@@ -440,8 +440,6 @@ class TestFAISSVectorStoreStrategyEdgeCases:
             type=VectorStoreType.FAISS,
             params={}
         )
-        embeddings = Mock()
-        
         test_cases = [
             ([0.1], 1),  # 1-dimensional
             ([0.1, 0.2], 2),  # 2-dimensional
@@ -450,6 +448,8 @@ class TestFAISSVectorStoreStrategyEdgeCases:
         ]
         
         for embedding_vector, expected_dimension in test_cases:
+            # Dimension is cached per embeddings instance, so use a fresh one per case
+            embeddings = Mock()
             embeddings.embed_query.return_value = embedding_vector
             
             with patch('src.paas_ai.core.rag.vectorstore.faiss.FAISS') as mock_faiss_class:
@@ -466,6 +466,41 @@ class TestFAISSVectorStoreStrategyEdgeCases:
                     mock_faiss.IndexFlatL2.assert_called_with(expected_dimension)
                     assert result == mock_vectorstore
     
+    def test_create_vectorstore_probes_dimension_once_per_embeddings(self):
+        """Test that the embedding dimension is only probed once per embeddings instance."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={}
+        )
+        embeddings = Mock()
+        embeddings.embed_query.return_value = [0.1, 0.2, 0.3]
+        
+        with patch('src.paas_ai.core.rag.vectorstore.faiss.FAISS'):
+            with patch('src.paas_ai.core.rag.vectorstore.faiss.faiss') as mock_faiss:
+                strategy.create_vectorstore(config, embeddings)
+                strategy.create_vectorstore(config, embeddings)
+                
+                embeddings.embed_query.assert_called_once()
+                assert mock_faiss.IndexFlatL2.call_args_list[-1].args == (3,)
+    
+    def test_create_vectorstore_uses_declared_dimension(self):
+        """Test that a dimension exposed by the embeddings model skips the probe."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={}
+        )
+        embeddings = Mock()
+        embeddings.dimensions = 384
+        
+        with patch('src.paas_ai.core.rag.vectorstore.faiss.FAISS'):
+            with patch('src.paas_ai.core.rag.vectorstore.faiss.faiss') as mock_faiss:
+                strategy.create_vectorstore(config, embeddings)
+                
+                embeddings.embed_query.assert_not_called()
+                mock_faiss.IndexFlatL2.assert_called_once_with(384)
+    
     def test_create_vectorstore_with_none_documents(self):
         """Test creating vector store with None documents."""
         strategy = FAISSVectorStoreStrategy()
@@ -592,6 +627,489 @@ class TestFAISSVectorStoreStrategyEdgeCases:
             strategy.validate_config(config)
 
 
+class TestFAISSIndexTypes:
+    """Test the faiss_index_type parameter."""
+    
+    def _embeddings(self, dimension=8):
+        from langchain_community.embeddings import FakeEmbeddings
+        return FakeEmbeddings(size=dimension)
+    
+    def test_hnsw_index_without_documents(self):
+        """Test that an empty HNSW index is built with the configured parameters."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "hnsw", "hnsw_m": 16, "ef_construction": 100, "ef_search": 32}
+        )
+        
+        result = strategy.create_vectorstore(config, self._embeddings())
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexHNSWFlat)
+        assert result.index.hnsw.efConstruction == 100
+        assert result.index.hnsw.efSearch == 32
+        assert result.index.d == 8
+    
+    def test_hnsw_index_with_documents(self):
+        """Test that documents are indexed and searchable through an HNSW index."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "HNSW"}
+        )
+        documents = [
+            Document(page_content=f"doc {i}", metadata={"i": i}) for i in range(5)
+        ]
+        
+        result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexHNSWFlat)
+        assert result.index.ntotal == 5
+        assert len(result.similarity_search("doc 1", k=2)) == 2
+    
+    @pytest.mark.parametrize("params", [
+        {"faiss_index_type": "HNSW"},
+        {"embedding_precision": "FP16"},
+        {"ingest_concurrency": 2, "embedding_batch_size": 2},
+    ], ids=["hnsw", "fp16", "concurrent"])
+    def test_prebuilt_index_keeps_document_ids(self, tmp_path, params):
+        """Test that documents indexed outside FAISS.from_documents keep their ids, also on disk."""
+        from langchain_community.vectorstores import FAISS
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params=params
+        )
+        documents = [Document(id=f"hash-{i}", page_content=f"doc {i}") for i in range(5)]
+        ids = [doc.id for doc in documents]
+        embeddings = self._embeddings()
+        
+        result = strategy.create_vectorstore(config, embeddings, documents)
+        loaded = FAISS.load_local(str(tmp_path), embeddings, allow_dangerous_deserialization=True)
+        
+        assert [doc.id for doc in result.get_by_ids(ids)] == ids
+        assert [doc.id for doc in loaded.get_by_ids(ids)] == ids
+    
+    def test_ivf_pq_index_with_documents(self):
+        """Test that an IVF_PQ index is trained on the documents and nprobe applied."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "IVF_PQ", "nlist": 4, "pq_m": 2, "pq_nbits": 4, "nprobe": 2}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(64)]
+        
+        result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexIVFPQ)
+        assert result.index.is_trained
+        assert result.index.nprobe == 2
+        assert result.index.ntotal == 64
+    
+    def test_ivf_pq_index_without_documents_raises(self):
+        """Test that IVF_PQ cannot be created without training data."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "IVF_PQ"}
+        )
+        
+        with pytest.raises(ValueError, match="requires documents to train on"):
+            strategy.create_vectorstore(config, self._embeddings())
+    
+    def test_index_params_not_forwarded_to_langchain(self):
+        """Test that index construction params are not passed to FAISS.from_documents."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "FLAT", "nprobe": 4, "index_type": "IndexFlatL2"}
+        )
+        documents = [Document(page_content="doc")]
+        embeddings = Mock()
+        
+        with patch('src.paas_ai.core.rag.vectorstore.faiss.FAISS') as mock_faiss_class:
+            strategy.create_vectorstore(config, embeddings, documents)
+            
+            mock_faiss_class.from_documents.assert_called_once_with(
+                documents=documents,
+                embedding=embeddings,
+                index_type="IndexFlatL2"
+            )
+    
+    def test_fp16_precision_uses_scalar_quantizer(self):
+        """Test that fp16 precision stores vectors in a half-precision scalar quantizer."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"embedding_precision": "fp16"}
+        )
+        
+        result = strategy.create_vectorstore(config, self._embeddings())
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexScalarQuantizer)
+        assert result.index.sq.qtype == faiss.ScalarQuantizer.QT_fp16
+    
+    def test_int8_precision_trained_on_documents(self):
+        """Test that int8 precision trains the quantizer on the documents."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"embedding_precision": "int8"}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(10)]
+        
+        result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexScalarQuantizer)
+        assert result.index.is_trained
+        assert result.index.ntotal == 10
+        assert len(result.similarity_search("doc 3", k=3)) == 3
+    
+    def test_int8_precision_with_hnsw(self):
+        """Test that precision combines with an HNSW graph."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "HNSW", "embedding_precision": "INT8"}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(10)]
+        
+        result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexHNSWSQ)
+        assert result.index.ntotal == 10
+    
+    def test_int8_precision_without_documents_raises(self):
+        """Test that int8 precision cannot be created without training data."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"embedding_precision": "int8"}
+        )
+        
+        with pytest.raises(ValueError, match="FLAT INT8 index requires documents to train on"):
+            strategy.create_vectorstore(config, self._embeddings())
+    
+    def test_documents_embedded_in_batches(self):
+        """Test that documents are embedded in embedding_batch_size batches."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"embedding_precision": "fp16", "embedding_batch_size": 4}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(10)]
+        embeddings = self._embeddings()
+        
+        with patch.object(type(embeddings), 'embed_documents', autospec=True, side_effect=lambda self, texts: [[0.1] * 8 for _ in texts]) as mock_embed:
+            result = strategy.create_vectorstore(config, embeddings, documents)
+        
+        assert [len(call.args[1]) for call in mock_embed.call_args_list] == [4, 4, 2]
+        assert result.index.ntotal == 10
+    
+    def test_ingest_concurrency_embeds_batches_in_parallel(self):
+        """Test that ingest_concurrency embeds batches on worker threads, keeping document order."""
+        import threading
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"ingest_concurrency": 3, "embedding_batch_size": 2}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(6)]
+        embeddings = self._embeddings()
+        threads = set()
+        
+        def embed(self, texts):
+            threads.add(threading.get_ident())
+            return [[float(text.split()[1])] * 8 for text in texts]
+        
+        with patch.object(type(embeddings), 'embed_documents', autospec=True, side_effect=embed):
+            result = strategy.create_vectorstore(config, embeddings, documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexFlatL2)
+        assert threading.get_ident() not in threads
+        assert [result.index.reconstruct(i)[0] for i in range(6)] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+        stored = [result.docstore.search(result.index_to_docstore_id[i]).page_content for i in range(6)]
+        assert stored == [doc.page_content for doc in documents]
+    
+    def test_validate_config_invalid_ingest_concurrency(self):
+        """Test configuration validation with a non-integer ingest_concurrency."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"ingest_concurrency": "8"}
+        )
+        
+        with pytest.raises(ValueError, match="ingest_concurrency must be a positive integer"):
+            strategy.validate_config(config)
+    
+    def test_validate_config_unsupported_precision(self):
+        """Test configuration validation with an unsupported precision."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"embedding_precision": "binary"}
+        )
+        
+        with pytest.raises(ValueError, match="Unsupported embedding_precision: BINARY"):
+            strategy.validate_config(config)
+    
+    def test_validate_config_precision_with_ivf_pq(self):
+        """Test that reduced precision is rejected for IVF_PQ indexes."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "IVF_PQ", "embedding_precision": "fp16"}
+        )
+        
+        with pytest.raises(ValueError, match="cannot be combined with IVF_PQ"):
+            strategy.validate_config(config)
+    
+    def test_validate_config_unsupported_index_type(self):
+        """Test configuration validation with an unsupported index type."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "LSH"}
+        )
+        
+        with pytest.raises(ValueError, match="Unsupported faiss_index_type: LSH"):
+            strategy.validate_config(config)
+
+
+    
+    def test_ivf_flat_index_with_documents(self):
+        """Test that documents are indexed and searchable through an IVF_FLAT index."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "IVF_FLAT", "nlist": 4, "nprobe": 4}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(40)]
+        
+        result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        import faiss
+        assert isinstance(result.index, faiss.IndexIVFFlat)
+        assert result.index.ntotal == 40
+        assert result.index.nprobe == 4
+        assert len(result.similarity_search("doc 1", k=2)) == 2
+
+    
+    def test_use_gpu_builds_on_gpu_and_returns_cpu_index(self):
+        """Test that use_gpu trains and adds on the GPU, then copies the index back."""
+        from src.paas_ai.core.rag.vectorstore import faiss as faiss_module
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"use_gpu": True, "faiss_index_type": "IVF_FLAT", "nlist": 2}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(20)]
+        
+        gpu = faiss_module.faiss
+        with patch.object(gpu, 'get_num_gpus', return_value=1), \
+                patch.object(gpu, 'StandardGpuResources', create=True) as mock_resources, \
+                patch.object(gpu, 'index_cpu_to_gpu', create=True, side_effect=lambda res, device, index: index) as mock_to_gpu, \
+                patch.object(gpu, 'index_gpu_to_cpu', create=True, side_effect=lambda index: index) as mock_to_cpu:
+            result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        to_gpu_args = mock_to_gpu.call_args.args
+        assert to_gpu_args[:2] == (mock_resources.return_value, 0)
+        assert to_gpu_args[2].is_trained  # moved before training, trained afterwards
+        mock_to_cpu.assert_called_once()
+        assert result.index.ntotal == 20
+    
+    def test_use_gpu_without_gpus_falls_back_to_cpu(self):
+        """Test that use_gpu is ignored when no GPU is available."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"use_gpu": True}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(5)]
+        
+        with patch('src.paas_ai.core.rag.vectorstore.faiss._gpu_available', return_value=False):
+            result = strategy.create_vectorstore(config, self._embeddings(), documents)
+        
+        assert result.index.ntotal == 5
+    
+    def test_validate_config_use_gpu_with_hnsw(self):
+        """Test that use_gpu is rejected for index types FAISS cannot run on GPU."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"use_gpu": True, "faiss_index_type": "HNSW"}
+        )
+        
+        with pytest.raises(ValueError, match="use_gpu requires a FP32 FLAT, IVF_FLAT or IVF_PQ index"):
+            strategy.validate_config(config)
+
+class TestFAISSAutotune:
+    """Test corpus-size based tuning via params['autotune']."""
+    
+    def test_small_corpus_keeps_flat_index(self):
+        """Test that small corpora keep the exact flat index."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        assert _autotune_index_params({"autotune": True}, 1_000) == {"autotune": True}
+    
+    def test_large_corpus_switches_to_ivf_flat(self):
+        """Test that corpora above the IVF threshold get nlist ~ 4*sqrt(N)."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        tuned = _autotune_index_params({}, 250_000)
+        
+        assert tuned == {"faiss_index_type": "IVF_FLAT", "nlist": 2000, "nprobe": 100}
+    
+    def test_very_large_corpus_switches_to_ivf_pq(self):
+        """Test that corpora above a million vectors get a compressed IVF_PQ index."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        tuned = _autotune_index_params({}, 4_000_000)
+        
+        assert tuned["faiss_index_type"] == "IVF_PQ"
+        assert tuned["nlist"] == 8000
+        assert tuned["nprobe"] == 400
+    
+    def test_reduced_precision_never_switches_to_pq(self):
+        """Test that autotune does not pick IVF_PQ alongside embedding_precision."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        tuned = _autotune_index_params({"embedding_precision": "FP16"}, 4_000_000)
+        
+        assert tuned["faiss_index_type"] == "IVF_FLAT"
+    
+    def test_explicit_params_are_kept(self):
+        """Test that configured index params are never overridden."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        tuned = _autotune_index_params({"faiss_index_type": "IVF_PQ", "nlist": 64}, 250_000)
+        
+        assert tuned == {"faiss_index_type": "IVF_PQ", "nlist": 64, "nprobe": 3}
+    
+    def test_hnsw_ef_search_scales_with_corpus(self):
+        """Test that HNSW efSearch is clamped to [32, 128] by log2(N)."""
+        from src.paas_ai.core.rag.vectorstore.faiss import _autotune_index_params
+        
+        assert _autotune_index_params({"faiss_index_type": "HNSW"}, 100)["ef_search"] == 53
+        assert _autotune_index_params({"faiss_index_type": "HNSW"}, 10)["ef_search"] == 32
+        assert _autotune_index_params({"faiss_index_type": "HNSW"}, 10**9)["ef_search"] == 128
+    
+    def test_create_vectorstore_applies_autotune(self):
+        """Test that create_vectorstore tunes HNSW from the document count."""
+        from langchain_community.embeddings import FakeEmbeddings
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"faiss_index_type": "HNSW", "autotune": True}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(100)]
+        
+        result = strategy.create_vectorstore(config, FakeEmbeddings(size=8), documents)
+        
+        assert result.index.hnsw.efSearch == 53
+    
+    def test_validate_config_autotune_must_be_bool(self):
+        """Test configuration validation with a non-boolean autotune flag."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"autotune": 1}
+        )
+        
+        with pytest.raises(ValueError, match="autotune must be a boolean"):
+            strategy.validate_config(config)
+
+
+class TestFAISSMemoryMappedLoad:
+    """Test loading a persisted index with the mmap parameter."""
+    
+    def _persist(self, strategy, directory, params=None):
+        from langchain_community.embeddings import DeterministicFakeEmbedding
+        embeddings = DeterministicFakeEmbedding(size=8)
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(directory),
+            params=params or {}
+        )
+        documents = [Document(page_content=f"doc {i}") for i in range(20)]
+        strategy.create_vectorstore(config, embeddings, documents)
+        return embeddings
+    
+    def test_mmap_load_is_searchable(self, tmp_path):
+        """Test that a memory-mapped store returns the same results as a regular load."""
+        from src.paas_ai.core.rag.vectorstore.faiss import MemoryMappedFAISS
+        strategy = FAISSVectorStoreStrategy()
+        embeddings = self._persist(strategy, tmp_path)
+        
+        mapped = strategy.load_vectorstore(VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params={"mmap": True, "allow_dangerous_deserialization": True}
+        ), embeddings)
+        loaded = strategy.load_vectorstore(VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params={"allow_dangerous_deserialization": True}
+        ), embeddings)
+        
+        assert isinstance(mapped, MemoryMappedFAISS)
+        assert mapped.similarity_search("doc 3", k=3) == loaded.similarity_search("doc 3", k=3)
+    
+    def test_mmap_load_applies_nprobe(self, tmp_path):
+        """Test that nprobe is applied to a memory-mapped IVF_PQ index."""
+        strategy = FAISSVectorStoreStrategy()
+        embeddings = self._persist(strategy, tmp_path, {"faiss_index_type": "IVF_PQ", "nlist": 2, "pq_m": 2, "pq_nbits": 4})
+        
+        result = strategy.load_vectorstore(VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params={"mmap": True, "nprobe": 2, "allow_dangerous_deserialization": True}
+        ), embeddings)
+        
+        import faiss
+        assert faiss.extract_index_ivf(result.index).nprobe == 2
+    
+    def test_mmap_store_rejects_writes(self, tmp_path):
+        """Test that adding to a memory-mapped store raises instead of aborting in FAISS."""
+        strategy = FAISSVectorStoreStrategy()
+        embeddings = self._persist(strategy, tmp_path)
+        
+        result = strategy.load_vectorstore(VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params={"mmap": True, "allow_dangerous_deserialization": True}
+        ), embeddings)
+        
+        with pytest.raises(ValueError, match="loaded with mmap and is read-only"):
+            result.add_documents([Document(page_content="new doc")])
+    
+    def test_mmap_load_requires_dangerous_deserialization(self, tmp_path):
+        """Test that the docstore is not unpickled without the explicit opt-in."""
+        strategy = FAISSVectorStoreStrategy()
+        embeddings = self._persist(strategy, tmp_path)
+        
+        result = strategy.load_vectorstore(VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            persist_directory=str(tmp_path),
+            params={"mmap": True}
+        ), embeddings)
+        
+        assert result is None
+    
+    def test_validate_config_mmap_must_be_bool(self):
+        """Test configuration validation with a non-boolean mmap flag."""
+        strategy = FAISSVectorStoreStrategy()
+        config = VectorStoreConfig(
+            type=VectorStoreType.FAISS,
+            params={"mmap": "yes"}
+        )
+        
+        with pytest.raises(ValueError, match="mmap must be a boolean"):
+            strategy.validate_config(config)
+
+
 class TestFAISSVectorStoreStrategyIntegration:
     """Integration tests for FAISSVectorStoreStrategy."""
     
@@ -21,6 +21,18 @@ from src.paas_ai.core.rag.vectorstore.pinecone import PineconeVectorStoreStrateg
 from src.paas_ai.core.config.schemas import VectorStoreConfig, VectorStoreType
 
 
+def fake_client(persist_directory):
+    """Stand-in for the shared Chroma client of a persist directory."""
+    return ("chroma-client", persist_directory)
+
+
+@pytest.fixture(autouse=True)
+def shared_chroma_clients():
+    """Keep tests from opening real persistent Chroma clients."""
+    with patch('src.paas_ai.core.rag.vectorstore.chroma._get_client', side_effect=fake_client) as mock_get_client:
+        yield mock_get_client
+
+
 @pytest.fixture
 def mock_vectorstore():
     """Fixture providing a consistent mock vectorstore."""
@@ -86,7 +98,7 @@ class TestVectorStoreIntegration:
                     documents=documents,
                     embedding=embeddings,
                     collection_name="test_collection",
-                    persist_directory="/tmp/chroma_test",
+                    client=fake_client("/tmp/chroma_test"),
                 )
                 
                 assert result == mock_vectorstore
@@ -205,6 +205,46 @@ class TestColoredFormatter:
         assert "⏳" in formatted
         assert "PROGRESS" in formatted
         assert "Progress message" in formatted
+    
+    def test_format_unknown_level_falls_back_to_info_style(self):
+        """Test that levels outside LogLevel use the INFO emoji and color."""
+        formatter = ColoredFormatter()
+        
+        record = logging.LogRecord(
+            name="test",
+            level=5,
+            pathname="test.py",
+            lineno=1,
+            msg="Trace message",
+            args=(),
+            exc_info=None
+        )
+        
+        formatted = formatter.format(record)
+        
+        assert formatted.startswith("ℹ️ ")
+        assert "\x1b[32mLevel 5 \x1b[0m" in formatted
+    
+    def test_format_respects_settings_changed_after_init(self):
+        """Test that cached level parts follow use_colors/use_emojis changes."""
+        formatter = ColoredFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        formatter.format(record)
+        
+        formatter.use_colors = False
+        formatter.use_emojis = False
+        formatted = formatter.format(record)
+        
+        assert "ℹ️" not in formatted
+        assert "\x1b[" not in formatted
 
 
 class TestJSONFormatter:
@@ -317,6 +357,101 @@ class TestJSONFormatter:
         assert log_entry["exception"]["message"] == "Test exception"
         assert isinstance(log_entry["exception"]["traceback"], list)
     
+    def test_format_timestamp_matches_isoformat(self):
+        """Test that the cached timestamp matches datetime.isoformat output."""
+        formatter = JSONFormatter()
+        
+        for created in (1700000000.0, 1700000000.5, 1700000000.123456):
+            record = logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=1,
+                msg="Test message",
+                args=(),
+                exc_info=None
+            )
+            record.created = created
+            
+            log_entry = json.loads(formatter.format(record))
+            
+            assert log_entry["timestamp"] == datetime.fromtimestamp(created).isoformat()
+    
+    def test_format_without_orjson(self):
+        """Test that formatting falls back to the stdlib json module."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.extra_fields = {1: "non-string key"}
+        
+        with patch('paas_ai.utils.logging.orjson', None):
+            log_entry = json.loads(formatter.format(record))
+        
+        assert log_entry["message"] == "Test message"
+        assert log_entry["1"] == "non-string key"
+    
+    def test_format_unsupported_type_falls_back_to_json(self):
+        """Test that values orjson rejects are still serialized like json.dumps."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.extra_fields = {"big": 2 ** 70}
+        
+        log_entry = json.loads(formatter.format(record))
+        
+        assert log_entry["big"] == 2 ** 70
+    
+    def test_json_fallback_matches_orjson_output(self):
+        """Test that the stdlib fallback writes the same compact, non-ASCII output as orjson."""
+        pytest.importorskip("orjson")
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Déploiement réussi ✓",
+            args=(),
+            exc_info=None
+        )
+        
+        expected = formatter.format(record)
+        with patch('paas_ai.utils.logging.orjson', None):
+            assert formatter.format(record) == expected
+    
+    def test_format_non_serializable_value(self):
+        """Test that values neither encoder supports are written as strings."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.extra_fields = {"path": Path("/tmp/data")}
+        
+        with patch('paas_ai.utils.logging.orjson', None):
+            log_entry = json.loads(formatter.format(record))
+        
+        assert log_entry["path"] == "/tmp/data"
+    
     def test_format_traceback_lines(self):
         """Test the _format_traceback_lines method."""
         formatter = JSONFormatter()
@@ -342,6 +477,63 @@ class TestJSONFormatter:
         result = formatter._format_traceback_lines("invalid_tb")
         assert result == ["invalid_tb"]
 
+    
+    def _record(self, **attrs):
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=42,
+            msg='Test "quoted" message',
+            args=(),
+            exc_info=None
+        )
+        record.module = "test_module"
+        record.funcName = "test_function"
+        for key, value in attrs.items():
+            setattr(record, key, value)
+        return record
+    
+    def test_ndjson_matches_json_entry(self):
+        """Test that the ndjson template encodes the same object as the json path."""
+        record = self._record(context="test-context")
+        
+        ndjson = JSONFormatter("ndjson").format(record)
+        
+        assert json.loads(ndjson) == json.loads(JSONFormatter().format(record))
+        assert "\n" not in ndjson
+    
+    def test_ndjson_with_extra_fields(self):
+        """Test that ndjson records with extra fields keep them."""
+        record = self._record(extra_fields={"request_id": "abc"})
+        
+        log_entry = json.loads(JSONFormatter("ndjson").format(record))
+        
+        assert log_entry["request_id"] == "abc"
+        assert log_entry["message"] == 'Test "quoted" message'
+    
+    def test_ndjson_non_serializable_context(self):
+        """Test that the ndjson template serializes context like the json path."""
+        record = self._record(context=Path("/tmp/data"))
+        
+        log_entry = json.loads(JSONFormatter("ndjson").format(record))
+        
+        assert log_entry["context"] == "/tmp/data"
+    
+    def test_msgpack_format(self):
+        """Test that the msgpack format packs the log entry."""
+        msgpack = pytest.importorskip("msgpack")
+        record = self._record()
+        
+        packed = JSONFormatter("msgpack").format(record)
+        
+        assert isinstance(packed, bytes)
+        assert msgpack.unpackb(packed) == json.loads(JSONFormatter().format(record))
+    
+    def test_invalid_format(self):
+        """Test that unknown output formats are rejected."""
+        with pytest.raises(ValueError, match="Invalid log format: xml"):
+            JSONFormatter("xml")
 
 class TestPaaSLogger:
     """Test the PaaSLogger class."""
@@ -379,6 +571,31 @@ class TestPaaSLogger:
         finally:
             tmp_path.unlink(missing_ok=True)
     
+    def test_file_output_written_by_background_listener(self):
+        """Test that file records go through a queue to a shared background writer."""
+        from logging.handlers import QueueHandler
+        
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        
+        try:
+            first = PaaSLogger("test_logger_a", console_output=False, file_output=tmp_path)
+            second = PaaSLogger("test_logger_b", console_output=False, file_output=str(tmp_path))
+            
+            assert isinstance(first.logger.handlers[0], QueueHandler)
+            # Both loggers feed the same writer for the same file
+            assert first.logger.handlers[0].queue is second.logger.handlers[0].queue
+            
+            first.info("First message")
+            second.info("Second message")
+            first.flush()
+            
+            with open(tmp_path, 'r') as f:
+                messages = [json.loads(line)["message"] for line in f]
+            assert messages == ["First message", "Second message"]
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
     def test_init_no_console_output(self):
         """Test PaaSLogger initialization without console output."""
         logger = PaaSLogger("test_logger", console_output=False)
@@ -467,7 +684,7 @@ class TestPaaSLogger:
     
     def test_custom_level_logging(self):
         """Test logging with custom levels."""
-        logger = PaaSLogger("test_logger")
+        logger = PaaSLogger("test_logger", level="DEBUG")
         
         # Mock the logger.log method
         logger.logger.log = Mock()
@@ -482,6 +699,21 @@ class TestPaaSLogger:
         call_args = logger.logger.log.call_args
         assert call_args[1]["extra"]["custom_level"] == "progress"
     
+    def test_log_below_level_skipped(self):
+        """Test that records below the logger level never reach logging."""
+        logger = PaaSLogger("test_logger", level="WARNING")
+        
+        # Mock the logger.log method
+        logger.logger.log = Mock()
+        
+        logger.debug("Debug message")
+        logger.progress("Progress message")
+        logger.info("Info message")
+        logger.warning("Warning message")
+        
+        logger.logger.log.assert_called_once()
+        assert logger.logger.log.call_args[0][0] == logging.WARNING
+    
     def test_standard_logging_methods(self):
         """Test all standard logging methods."""
         logger = PaaSLogger("test_logger")
@@ -576,6 +808,52 @@ class TestGetLogger:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    
+    def test_get_logger_disables_colors_without_tty(self):
+        """Test that colors are dropped when stdout is redirected."""
+        with patch.object(sys, 'stdout', Mock(isatty=Mock(return_value=False))):
+            logger = get_logger("test_logger")
+        
+        assert logger.logger.handlers[0].formatter.use_colors is False
+    
+    def test_get_logger_keeps_colors_on_tty(self):
+        """Test that colors stay enabled when stdout is a terminal."""
+        with patch.object(sys, 'stdout', Mock(isatty=Mock(return_value=True))), \
+                patch.dict('os.environ', {}, clear=False) as environ, \
+                patch('paas_ai.utils.logging._enable_ansi') as mock_enable_ansi:
+            environ.pop('NO_COLOR', None)
+            logger = get_logger("test_logger")
+        
+        assert logger.logger.handlers[0].formatter.use_colors is True
+        mock_enable_ansi.assert_called_once()
+    
+    def test_get_logger_honors_no_color(self):
+        """Test that NO_COLOR disables colors even on a terminal."""
+        with patch.object(sys, 'stdout', Mock(isatty=Mock(return_value=True))), \
+                patch.dict('os.environ', {'NO_COLOR': '1'}):
+            logger = get_logger("test_logger")
+        
+        assert logger.logger.handlers[0].formatter.use_colors is False
+
+    
+    def test_get_logger_msgpack_file(self):
+        """Test that file_format='msgpack' writes packed records to the log file."""
+        msgpack = pytest.importorskip("msgpack")
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        
+        try:
+            logger = get_logger("msgpack_logger", console=False, file_path=tmp_path, file_format="msgpack")
+            logger.info("first")
+            logger.warning("second")
+            logger.flush()
+            
+            with open(tmp_path, "rb") as f:
+                entries = list(msgpack.Unpacker(f))
+            assert [entry["message"] for entry in entries] == ["first", "second"]
+            assert entries[1]["level"] == "WARNING"
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
 class TestLoggingConstants:
     """Test logging constants and mappings."""
@@ -656,6 +934,7 @@ class TestIntegration:
             # Clear context and log without context
             logger.clear_context()
             logger.info("Message without context")
+            logger.flush()
             
             # Check that file was written to
             assert tmp_path.exists()
@@ -693,6 +972,7 @@ class TestIntegration:
                 raise ValueError("Integration test exception")
             except ValueError:
                 logger.exception("Caught exception in integration test")
+            logger.flush()
             
             # Verify exception was logged
             with open(tmp_path, 'r') as f: